@@ -1,17 +1,32 @@
 from .base import BaseAgent
-from ..tools.registry import get_tool
+from ..tools.registry import TOOL_LIST, TOOL_POSITIONAL, get_tool, is_positional
 
 class ToolAgent(BaseAgent):
     """ Agent that wraps a tool from the registry. """
+    tool_idx = None  # registry slot, set by make_agent when the compiler already resolved the tool
+
     def execute(self, context: dict) -> dict:
         """ Execute the tool with provided context. """
         tool_name = self.params.get("tool")
         if not tool_name:
             raise ValueError(f"ToolAgent {self.node_id} missing 'tool' parameter")
         
-        fn = get_tool(tool_name)
-        args = {k: context.get(k) for k in self.inputs if k in context}
-        result = fn(**args)
+        if self.tool_idx is not None:
+            # read per call so a re-registered tool's convention takes effect
+            fn = TOOL_LIST[self.tool_idx]
+            call_spec = self.inputs if TOOL_POSITIONAL[self.tool_idx] else None
+        else:
+            fn = get_tool(tool_name)
+            call_spec = self.inputs if is_positional(tool_name) else None
+        
+        if call_spec is not None:
+            if len(call_spec) == 1:
+                result = fn(context.get(call_spec[0]))
+            else:
+                result = fn(*[context.get(k) for k in call_spec])
+        else:
+            args = {k: context.get(k) for k in self.inputs if k in context}
+            result = fn(**args)
         
         # Ensure result is a dict
         if not isinstance(result, dict):
@@ -10,38 +10,57 @@ class WorkflowCallAgent(BaseAgent):
     Params expected in node.params:
       - workflow_file: path to a YAML file relative to repo root or absolute
       - workflow_text: inline YAML string (optional, takes precedence over file)
+      - workflow: inline, already-parsed workflow mapping (optional, takes
+        precedence over workflow_text and avoids a second YAML parse)
     """
 
+    # compiled child workflow and the key it was loaded under: None for an inline
+    # source, which never changes, or (path, mtime, size) so file edits are picked up
+    _workflow = None
+    _workflow_key = None
+
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         # Build inputs for the called workflow from the current context
         inputs = {k: context.get(k) for k in self.inputs if k in context}
 
+        # Reuse the compiled child while its source is unchanged, then run it
+        key, source = self._workflow_source()
+        if self._workflow is None or self._workflow_key != key:
+            self._workflow = compiler.load_workflow(source if source is not None else _read(key[0]))
+            self._workflow_key = key
+        outputs = executor.run_workflow(self._workflow, inputs)
+
+        # Return outputs to be merged into parent's context
+        return outputs
+
+    def _workflow_source(self):
+        """Return (cache key, inline source or None for a file)."""
         # Determine workflow source
-        yaml_text = None
+        source = None
         if self.params and isinstance(self.params, dict):
-            yaml_text = self.params.get("workflow_text")
+            source = self.params.get("workflow") or self.params.get("workflow_text")
             wf_file = self.params.get("workflow_file")
         else:
             wf_file = None
 
-        if not yaml_text:
-            if not wf_file:
-                # fallback: try using a workflow with same id in workflows/ directory
-                wf_file = os.path.join(os.getcwd(), "workflows", f"{self.node_id}.yaml")
+        if source:
+            return None, source
 
-            if not os.path.isabs(wf_file):
-                # allow relative path
-                wf_file = os.path.join(os.getcwd(), wf_file)
+        if not wf_file:
+            # fallback: try using a workflow with same id in workflows/ directory
+            wf_file = os.path.join(os.getcwd(), "workflows", f"{self.node_id}.yaml")
 
-            if not os.path.exists(wf_file):
-                raise FileNotFoundError(f"Workflow file not found: {wf_file}")
+        if not os.path.isabs(wf_file):
+            # allow relative path
+            wf_file = os.path.join(os.getcwd(), wf_file)
 
-            with open(wf_file, 'r') as f:
-                yaml_text = f.read()
+        if not os.path.exists(wf_file):
+            raise FileNotFoundError(f"Workflow file not found: {wf_file}")
 
-        # Load workflow and run it
-        wf = compiler.load_workflow(yaml_text)
-        outputs = executor.run_workflow(wf, inputs)
+        st = os.stat(wf_file)
+        return (wf_file, st.st_mtime_ns, st.st_size), None
 
-        # Return outputs to be merged into parent's context
-        return outputs
+
+def _read(path: str) -> str:
+    with open(path, 'r') as f:
+        return f.read()
@@ -16,6 +16,13 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple, Dict
 import re
 
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 # -------------------------
 # RESULT CONTAINERS
@@ -108,23 +115,27 @@ def validate_yaml_against_schema(yaml_text: str, schema: Dict) -> Tuple[bool, Li
     Simple validation stub. Replace with schema.
     Returns (ok, errors).
     """
+    try:
+        data = yaml.load(yaml_text, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        return (False, [f"Invalid YAML: {e}"])
+    if not isinstance(data, dict):
+        return (False, ["Top-level YAML must be a mapping."])
+    return _validate_dict_against_schema(data, schema)
+
+
+def _validate_dict_against_schema(data: Dict, schema: Dict) -> Tuple[bool, List[str]]:
+    """Validate an already-parsed spec dict. Returns (ok, errors)."""
     errors: List[str] = []
 
     required_top = schema.get("required", [])
     for field in required_top:
-        pattern = rf"^{field}:\s*"
-        if not re.search(pattern, yaml_text, flags=re.MULTILINE):
+        if field not in data:
             errors.append(f"Missing required top-level field: {field}")
 
-    # Example: ensure steps looks like a YAML list of dicts with 'id' and 'type'
-    if "steps" in required_top:
-        steps_section = _extract_yaml_block(yaml_text, "steps")
-        if not steps_section:
-            errors.append("Missing 'steps' block.")
-        else:
-            if "- id:" not in steps_section or "- type:" not in yaml_text:
-                # coarse check; tighten as your schema matures
-                pass
+    # Example: a present but empty steps block; tighten as your schema matures
+    if "steps" in required_top and "steps" in data and not data["steps"]:
+        errors.append("Missing 'steps' block.")
 
     return (len(errors) == 0, errors)
 
@@ -200,31 +211,6 @@ def _extract_yaml_warnings(yaml_text: str) -> List[str]:
         warnings.append(match.strip())
     return warnings
 
-def _extract_yaml_block(yml: str, key: str) -> str:
-    """Extract a simple YAML block by key (indented lines following 'key:')."""
-    pattern = rf"^{key}:\s*$"
-    lines = yml.splitlines()
-    out: List[str] = []
-    capturing = False
-    base_indent = None
-    for line in lines:
-        if re.match(pattern, line):
-            capturing = True
-            base_indent = None
-            continue
-        if capturing:
-            if not line.strip():
-                out.append(line)
-                continue
-            indent = len(line) - len(line.lstrip(" "))
-            if base_indent is None:
-                base_indent = indent
-            if indent >= base_indent:
-                out.append(line)
-            else:
-                break
-    return "\n".join(out)
-
 def _extract_keywords(text: str) -> List[str]:
     words = re.findall(r"[A-Za-z]{4,}", text.lower())
     stop = {
@@ -9,10 +9,12 @@ The meta-agent follows this cycle:
 5. Recombine all results into final solution
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from src.workflow.guards import evaluate_condition
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+import functools
+import re
 import time
 
 
@@ -34,6 +36,24 @@ class Task:
     execution_time: float = 0.0
     verification_log: List[str] = field(default_factory=list)
 
+    # Wiring declared by YAML loaders
+    outputs: Dict[str, Any] = field(default_factory=dict)  # parent_key -> child output key
+    io_outputs: List[str] = field(default_factory=list)
+    guard_conditions: List[str] = field(default_factory=list)  # incoming edge guards
+
+    def clone(self) -> 'Task':
+        """Return a fresh, pending copy of this task tree (cheaper than copy.deepcopy)."""
+        return replace(
+            self,
+            inputs=dict(self.inputs or {}),
+            verification_criteria=list(self.verification_criteria or []),
+            status="pending",
+            result=None,
+            sub_tasks=[t.clone() for t in self.sub_tasks],
+            execution_time=0.0,
+            verification_log=[],
+        )
+
 
 @dataclass
 class DecompositionResult:
@@ -78,7 +98,7 @@ class MetaAgent:
         self.executor = executor
         self.verifier = verifier
         self.combiner = combiner
-        self.execution_log: List[Dict[str, Any]] = []
+        self.execution_log: List[Tuple[float, str]] = []  # (monotonic timestamp, message)
         
     def solve(self, task: Task, depth: int = 0) -> Dict[str, Any]:
         """
@@ -129,7 +149,7 @@ class MetaAgent:
                         res = sub_result.get('result')
                         if isinstance(res, dict):
                             # If the sub_task declared an outputs mapping, prefer mapping child keys
-                            outputs_map = getattr(sub_task, 'outputs', {}) or {}
+                            outputs_map = sub_task.outputs or {}
                             if isinstance(outputs_map, dict) and outputs_map:
                                 for parent_key, child_key in outputs_map.items():
                                     # child_key can be a string naming the child's output
@@ -212,7 +232,7 @@ class MetaAgent:
                             # if input placeholder is None, try to pull same-named value from context
                             sub_task.inputs[k] = context.get(k)
                 # If the loader attached guard_conditions, evaluate them against current context
-                guards = getattr(sub_task, 'guard_conditions', None)
+                guards = sub_task.guard_conditions
                 if guards:
                     should_run = False
                     # If any incoming guard is unspecified or 'true', treat as runnable; otherwise require at least one true
@@ -232,7 +252,7 @@ class MetaAgent:
                 # Update context with any named outputs produced by the sub-task
                 res = sub_result.get('result')
                 if isinstance(res, dict):
-                    outputs_map = getattr(sub_task, 'outputs', {}) or {}
+                    outputs_map = sub_task.outputs or {}
                     if isinstance(outputs_map, dict) and outputs_map:
                         for parent_key, child_key in outputs_map.items():
                             if isinstance(child_key, str) and child_key in res:
@@ -336,12 +356,8 @@ class MetaAgent:
             }
     
     def _log(self, message: str):
-        """Add a message to execution log."""
-        log_entry = {
-            'timestamp': time.time(),
-            'message': message
-        }
-        self.execution_log.append(log_entry)
+        """Add a (timestamp, message) entry to execution log."""
+        self.execution_log.append((time.monotonic(), message))
         print(message)  # Also print for real-time feedback
 
 
@@ -356,6 +372,38 @@ class AbstractTaskDecomposer(ABC):
         raise NotImplementedError()
 
 
+_SIMPLE_KEYWORDS = ('calculate', 'fetch', 'validate', 'check', 'send', 'get', 'set')
+# Conjunction splitters, compiled once
+_AND_RE = re.compile(r"\s+and\s+", re.IGNORECASE)
+_THEN_RE = re.compile(r"\s+then\s+", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=512)
+def _decompose_plan(description: str, is_atomic: bool) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Pure parsing step of TaskDecomposer, memoized on (description, is_atomic).
+    
+    Returns (split, parts) where split is "atomic" if the task is simple enough to
+    execute directly, "and"/"then" if it splits into parts, or "" otherwise.
+    """
+    if is_atomic:
+        return "atomic", ()
+    
+    and_parts = _AND_RE.split(description)
+    
+    # Check if description suggests it's a single action
+    desc_lower = description.lower()
+    if len(and_parts) == 1 and any(keyword in desc_lower for keyword in _SIMPLE_KEYWORDS):
+        return "atomic", ()
+    
+    if len(and_parts) > 1:
+        return "and", tuple(part.strip() for part in and_parts)
+    then_parts = _THEN_RE.split(description)
+    if len(then_parts) > 1:
+        return "then", tuple(part.strip() for part in then_parts)
+    return "", ()
+
+
 class TaskDecomposer(AbstractTaskDecomposer):
     """
     Decomposes high-level tasks into simpler, verifiable sub-tasks.
@@ -408,31 +456,22 @@ class TaskDecomposer(AbstractTaskDecomposer):
     
     def _is_simple_enough(self, task: Task) -> bool:
         """Determine if task is simple enough to execute without further decomposition."""
-        # Simple heuristics for MVP
-        if task.is_atomic:
-            return True
-        
-        # Check if description suggests it's a single action
-        simple_keywords = ['calculate', 'fetch', 'validate', 'check', 'send', 'get', 'set']
-        desc_lower = task.description.lower()
-        
-        return any(keyword in desc_lower and desc_lower.count(' and ') == 0 
-                   for keyword in simple_keywords)
+        split, _ = _decompose_plan(task.description, task.is_atomic)
+        return split == "atomic"
     
     def _heuristic_decompose(self, task: Task, depth: int) -> List[Task]:
         """Use heuristics to decompose task."""
-        # For MVP: look for indicators
-        desc = task.description.lower()
+        # The description parsing is memoized; only the Task objects are built per call
+        split, parts = _decompose_plan(task.description, task.is_atomic)
         
         sub_tasks = []
         
         # Split on "and" for parallel tasks
-        if ' and ' in desc:
-            parts = task.description.split(' and ')
+        if split == "and":
             for i, part in enumerate(parts):
                 sub_tasks.append(Task(
                     id=f"{task.id}.{i+1}",
-                    description=part.strip(),
+                    description=part,
                     inputs=task.inputs,
                     is_atomic=True,
                     parent_id=task.id,
@@ -440,12 +479,11 @@ class TaskDecomposer(AbstractTaskDecomposer):
                 ))
         
         # Split on "then" for sequential tasks
-        elif ' then ' in desc:
-            parts = task.description.split(' then ')
+        elif split == "then":
             for i, part in enumerate(parts):
                 sub_tasks.append(Task(
                     id=f"{task.id}.{i+1}",
-                    description=part.strip(),
+                    description=part,
                     inputs=task.inputs if i == 0 else {},  # Only first task gets inputs
                     is_atomic=True,
                     parent_id=task.id,
@@ -453,9 +491,6 @@ class TaskDecomposer(AbstractTaskDecomposer):
                 ))
         
         # If no obvious decomposition, mark as atomic
-        if not sub_tasks:
-            return []
-        
         return sub_tasks
     
     def _determine_strategy(self, sub_tasks: List[Task]) -> str:
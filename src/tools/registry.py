@@ -1,10 +1,49 @@
-from typing import Callable, Dict
+import copy
+import functools
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
 
 _TOOLS: Dict[str, Callable] = {}
+# One slot per tool name, in registration order. Nodes resolve a tool to its
+# slot at load time and dispatch by index; re-registering a name replaces the
+# callable and its calling convention in place. Read-only outside this module.
+TOOL_LIST: List[Callable] = []
+TOOL_POSITIONAL: List[bool] = []
+TOOL_BATCH: List[Optional[Callable[[List[Dict[str, Any]]], List[Any]]]] = []
+_TOOL_INDEX: Dict[str, int] = {}
+_PURE_CACHE_SIZE = 1024
+
+def register_tool(name: str, pure: bool = False, positional: bool = False,
+                  batch_fn: Optional[Callable[[List[Dict[str, Any]]], List[Any]]] = None,
+                  out_param: bool = False):
+    """
+    Register a tool under name. Pure tools (same arguments, same result, no side
+    effects) are stored behind a per-tool LRU cache keyed on their frozen arguments.
+    Positional tools are called with their node's inputs as positional arguments,
+    in io.inputs order, instead of as keywords.
+    batch_fn, if given, takes a list of keyword-argument dicts and returns one
+    result per call; the executor uses it when several nodes of one layer share
+    this tool.
+    Out-param tools take the output dict as their first argument and fill it in
+    place instead of returning one.
+    The decorated function itself is returned unchanged.
+    """
+    name = sys.intern(name)
 
-def register_tool(name: str):
     def _wrap(fn):
-        _TOOLS[name] = fn
+        call = _fill_out(fn) if out_param else fn
+        _TOOLS[name] = _memoize(call) if pure else call
+        if name not in _TOOL_INDEX:
+            _TOOL_INDEX[name] = len(TOOL_LIST)
+            TOOL_LIST.append(None)
+            TOOL_POSITIONAL.append(False)
+            TOOL_BATCH.append(None)
+        idx = _TOOL_INDEX[name]
+        TOOL_LIST[idx] = _TOOLS[name]
+        TOOL_POSITIONAL[idx] = positional
+        TOOL_BATCH[idx] = batch_fn
         return fn
     return _wrap
 
@@ -13,6 +52,59 @@ def get_tool(name: str) -> Callable:
         raise ValueError(f"Tool not found: {name}")
     return _TOOLS[name]
 
+def tool_index(name: str) -> int:
+    if name not in _TOOL_INDEX:
+        raise ValueError(f"Tool not found: {name}")
+    return _TOOL_INDEX[name]
+
+def is_positional(name: str) -> bool:
+    return name in _TOOL_INDEX and TOOL_POSITIONAL[_TOOL_INDEX[name]]
+
+def _fill_out(fn: Callable) -> Callable:
+    """Adapt an out-param tool to the usual call-and-return-a-dict protocol."""
+    @functools.wraps(fn)
+    def call(*args, **kwargs):
+        out: Dict[str, Any] = {}
+        fn(out, *args, **kwargs)
+        return out
+    return call
+
+def _memoize(fn: Callable) -> Callable:
+    cache: "OrderedDict[Any, Any]" = OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(fn)
+    def cached(*args, **kwargs):
+        try:
+            key = (_freeze(args), _freeze(kwargs))
+            hash(key)
+        except TypeError:  # unhashable or unorderable arguments: just call through
+            return fn(*args, **kwargs)
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                # hand out copies so callers can't mutate the cached result
+                return copy.deepcopy(cache[key])
+        result = fn(*args, **kwargs)
+        with lock:
+            cache[key] = result
+            if len(cache) > _PURE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    cached.cache_clear = cache.clear
+    return cached
+
+def _freeze(value: Any) -> Any:
+    """Turn nested containers into hashable tuples, tagged by type."""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(v) for v in value))
+    return (type(value), value)  # keeps 1, 1.0 and True apart
+
 # Example tool registration
 @register_tool("orders.get")
 def orders_get(order_id: str, customer_id: str) -> Dict[str, str]:
@@ -1,79 +1,171 @@
 """ Load and validate Workflow from YAML. """
 
+import functools
+import sys
 import yaml
+from typing import Any, Callable, Dict, List, Optional, Union
+from ..tools.registry import tool_index
+from .factory import make_agent
+from .guards import compile_condition, compile_conjunction, normalize
 from .models import Workflow, Node, Edge
 
-def load_workflow(yaml_text: str) -> Workflow:
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+def load_workflow(source: Union[str, Dict[str, Any]]) -> Workflow:
     """
-    Load a Workflow from a YAML string.
+    Load a Workflow from a YAML string or an already-parsed mapping.
+    Workflows loaded from text are cached on the text and shared between
+    callers, so they must be treated as read-only.
     """
-    data = yaml.safe_load(yaml_text)
+    if isinstance(source, dict):
+        return load_workflow_dict(source)
+    return _load_workflow_text(source)
 
+@functools.lru_cache(maxsize=128)
+def _load_workflow_text(text: str) -> Workflow:
+    return load_workflow_dict(yaml.load(text, Loader=_SafeLoader))
+
+def load_workflow_dict(data: Dict[str, Any]) -> Workflow:
+    """
+    Load a Workflow from an already-parsed YAML mapping.
+    """
     # basic validation
     for key in ["name", "inputs", "nodes", "edges", "success_criteria", "failure_conditions"]:
         if key not in data:
             raise ValueError(f"Missing required top-level field: {key}")
 
+    # Guards are compiled, tools resolved and agents bound here, once, so
+    # execution never re-parses expression text or rebuilds dispatch
     nodes = []
     for node_data in data.get("nodes", []):
+        tests = node_data.get("tests", [])
+        params = node_data.get("params", {})
+        if isinstance(params.get("tool"), str):
+            params = {**params, "tool": sys.intern(params["tool"])}
+        io_inputs = _intern_all(node_data.get("io", {}).get("inputs", []))
+        tool_idx = _resolve_tool(node_data["type"], params)
         nodes.append(Node(
-            id=node_data["id"],
+            id=_intern(node_data["id"]),
             type=node_data["type"],
             summary=node_data.get("summary", ""),
-            params=node_data.get("params", {}),
-            io_inputs=node_data.get("io", {}).get("inputs", []),
-            io_outputs=node_data.get("io", {}).get("outputs", []),
-            tests=node_data.get("tests", []),
+            params=params,
+            io_inputs=io_inputs,
+            io_outputs=_intern_all(node_data.get("io", {}).get("outputs", [])),
+            tests=tests,
+            test_checks=[compile_condition(normalize(t)) for t in tests],
+            tool_idx=tool_idx,
         ))
+        nodes[-1].step = _bind_step(nodes[-1])
     
     edges = []
     for edge_data in data.get("edges", []):
+        when = edge_data.get("when", "true")
         edges.append(Edge(
-            src=edge_data["from"],
-            dest=edge_data["to"],
-            when=edge_data.get("when", "true"),
+            src=_intern(edge_data["from"]),
+            dest=_intern(edge_data["to"]),
+            when=when,
+            when_check=compile_condition(normalize(when)),
         ))
 
+    preconditions = data.get("preconditions", [])
+    success_criteria = data.get("success_criteria", [])
+    failure_conditions = data.get("failure_conditions", [])
     workflow = Workflow(
         name=data["name"],
         description=data.get("description", ""),
-        preconditions=data.get("preconditions", []),
-        success_criteria=data.get("success_criteria", []),
-        failure_conditions=data.get("failure_conditions", []),
+        preconditions=preconditions,
+        success_criteria=success_criteria,
+        failure_conditions=failure_conditions,
         inputs=data.get("inputs", []),
         outputs=data.get("outputs", []),
         nodes=nodes,
         edges=edges,
+        precondition_checks=[compile_condition(e) for e in preconditions],
+        success_checks=[compile_condition(e) for e in success_criteria],
+        failure_checks=[compile_condition(e) for e in failure_conditions],
+        entry_check=compile_conjunction(preconditions),
+        exit_check=compile_conjunction(success_criteria, failure_conditions),
     )
-    _validate_workflow(workflow)
+    workflow.layers = _validate_workflow(workflow)
 
     return workflow
 
-def _validate_workflow(workflow: Workflow) -> None:
+def _intern(name: Any) -> Any:
+    # Ids and io names are dict keys on every run; interned keys compare by identity
+    return sys.intern(name) if isinstance(name, str) else name
+
+def _intern_all(names: List[Any]) -> List[Any]:
+    return [_intern(n) for n in names]
+
+def _resolve_tool(node_type: str, params: Dict[str, Any]) -> Optional[int]:
     """
-    Cyclic check on DAG (DFS)
+    Look up a tool node's registry slot, or None if it is not registered yet;
+    the agent then reports the missing tool when it runs, as before.
+    """
+    if node_type != "tool" or not params.get("tool"):
+        return None
+    try:
+        return tool_index(params["tool"])
+    except ValueError:
+        return None
+
+def _bind_step(node: Node) -> Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]:
+    """
+    Build the node's agent once and keep its bound execute, or None if the
+    node type has no agent; run_workflow then reports it when it runs.
+    Load-time agents are not counted, so loading alone leaves the creation
+    counter untouched.
+    """
+    try:
+        return make_agent(node, count=False).execute
+    except ValueError:
+        return None
+
+def _validate_workflow(workflow: Workflow) -> List[List[str]]:
+    """
+    Cyclic check on DAG; returns the Kahn layers of node ids.
     """
     node_ids = {node.id for node in workflow.nodes}
-    indegree = {node.id: 0 for node in workflow.nodes}
-    
     for edge in workflow.edges:
         if edge.src not in node_ids or edge.dest not in node_ids:
             raise ValueError(f"Edge references unknown node: {edge.src} -> {edge.dest}")
-        indegree[edge.dest] += 1
-    
-    queue = [node_id for node_id, deg in indegree.items() if deg == 0]
-    visited = 0
-    adjacency = {node.id: [] for node in workflow.nodes}
+    return topological_layers(workflow)
+
+def topological_layers(workflow: Workflow) -> List[List[str]]:
+    """
+    Group node ids into Kahn layers: each layer holds the nodes whose
+    predecessors all sit in earlier layers. The first layer is in workflow
+    node order; later layers are in the order their last incoming edge is
+    reached (nodes [A, B, C, D] with edges B->C, A->D give [[A, B], [D, C]]),
+    which is also the order outputs merge in when two nodes write the same name.
+    """
+    if not workflow.edges:  # no dependencies: everything runs in one layer
+        return [[node.id for node in workflow.nodes]] if workflow.nodes else []
+
+    indegree = {node.id: 0 for node in workflow.nodes}
+    adjacency: Dict[str, List[str]] = {node.id: [] for node in workflow.nodes}
     for edge in workflow.edges:
+        indegree[edge.dest] += 1
         adjacency[edge.src].append(edge.dest)
 
-    while queue:
-        current = queue.pop(0)
-        visited += 1
-        for neighbor in adjacency[current]:
-            indegree[neighbor] -= 1
-            if indegree[neighbor] == 0:
-                queue.append(neighbor)
-    
+    layers = []
+    frontier = [node_id for node_id, deg in indegree.items() if deg == 0]
+    visited = 0
+    while frontier:
+        layers.append(frontier)
+        visited += len(frontier)
+        next_frontier = []
+        for current in frontier:
+            for neighbor in adjacency[current]:
+                indegree[neighbor] -= 1
+                if indegree[neighbor] == 0:
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
     if visited != len(workflow.nodes):
-        raise ValueError("Cycle detected in Workflow DAG.")
\ No newline at end of file
+        raise ValueError("Cycle detected in Workflow DAG.")
+    return layers
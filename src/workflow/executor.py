@@ -1,10 +1,39 @@
+import threading
 import time
-from typing import Dict, Any
-from .guards import evaluate_condition
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .guards import compile_condition, normalize
+from .compiler import topological_layers
 from .factory import make_agent
-from .models import Workflow, Node, Edge
+from .models import Workflow, Node, Edge, Check
+from ..tools.registry import TOOL_BATCH
 
-def run_workflow(workflow: Workflow, inputs: Dict[str, Any], *, dry_run: bool = False) -> Dict[str, Any]:
+# Shared by every concurrent run; created on first use and never shut down per run
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ThreadPoolExecutor()
+    return _POOL
+
+
+def run_workflow(workflow: Workflow, inputs: Dict[str, Any], *, dry_run: bool = False,
+                 concurrent: bool = False) -> Dict[str, Any]:
+    """
+    Execute the workflow layer by layer. With concurrent=True, independent nodes
+    of a layer overlap on a shared thread pool; that only pays off for tools that
+    release the GIL (I/O, subprocesses), so in-process tools run sequentially by default.
+    """
+    if dry_run:
+        return _dry_run(workflow, inputs)
+    
     context: Dict[str, Any] = {
         "__start_ts": time.time(),
         "none": None,
@@ -13,58 +42,139 @@ def run_workflow(workflow: Workflow, inputs: Dict[str, Any], *, dry_run: bool =
         **inputs
     }
     
-    # repeatedly find ready nodes whose predecessors have run, follow guards
-    executed = set()
-    ready = [n for n in workflow.nodes if _indegree(workflow, n.id) == 0]
-
     # Check preconditions
-    for expression in workflow.preconditions:
-        assert evaluate_condition(expression, context), f"Precondition failed: {expression}"
+    # One fused predicate on the happy path; clause by clause only to report a failure
+    if workflow.entry_check is None or not workflow.entry_check(context):
+        for expression, check in _checks(workflow.preconditions, workflow.precondition_checks):
+            if not check(context):
+                raise AssertionError("Precondition failed: %s" % expression)
     
     # Adjacency
-    in_edges: Dict[str, Any] = {}
+    by_id = {n.id: n for n in workflow.nodes}
     out_edges: Dict[str, Any] = {}
+    pending = Counter()  # predecessors not yet executed, per node
     for edge in workflow.edges:
         out_edges.setdefault(edge.src, []).append(edge)
-        in_edges.setdefault(edge.dest, []).append(edge)
-        in_edges.setdefault(edge.src, in_edges.get(edge.src, []))
+        pending[edge.dest] += 1
     
-    while ready:
-        node = ready.pop(0)
-        if node.id in executed:
+    # Walk the load-time Kahn layers. A layer's nodes have no edges between
+    # them, but edgeless nodes may still pass data through the context, so only
+    # layers whose nodes don't read each other's outputs are batched or overlapped.
+    layers = workflow.layers if workflow.layers is not None else topological_layers(workflow)
+    activated = set(layers[0]) if layers else set()
+    for layer_ids in layers:
+        layer = [by_id[node_id] for node_id in layer_ids if node_id in activated]
+        if len(layer) == 1 or not _independent(layer):
+            # Node order, each node seeing the outputs of the ones before it
+            for node in layer:
+                _merge(node, _run_node(node, context), context, out_edges, pending, activated)
             continue
         
-        agent = make_agent(node)
-        produced = agent.dry_run(context) if dry_run else agent.execute(context)
-        context.update(produced)
-
-        for test in node.tests:
-            assert evaluate_condition(_normalize(test), context), f"Test failed for node {node.id}: {test}"
+        # Nodes sharing a batch-capable tool go in one call; with concurrent=True
+        # the rest overlap on the pool. Nothing writes to the context until the
+        # whole layer is back, so workers share a read-only view.
+        results = _run_batched(layer, context)
+        rest = [i for i in range(len(layer)) if i not in results]
+        if concurrent and len(rest) > 1:
+            view = MappingProxyType(context)
+            steps = [layer[i].step or make_agent(layer[i]).execute for i in rest]
+            results.update(zip(rest, _pool().map(lambda step: step(view), steps)))
+        else:
+            for i in rest:
+                results[i] = _run_node(layer[i], context)
         
-        executed.add(node.id)
-    
-        # Successors
-        for edge in out_edges.get(node.id, []):
-            if evaluate_condition(_normalize(edge.when), context):
-                dest_node = next(n for n in workflow.nodes if n.id == edge.dest)
-                if all(pred.src in executed for pred in in_edges.get(dest_node.id, [])):
-                    ready.append(dest_node)
+        # Merge in node order so later nodes win exactly as in a sequential run
+        for i, node in enumerate(layer):
+            _merge(node, results[i], context, out_edges, pending, activated)
     
-    # Check success criteria
-    for expression in workflow.success_criteria:
-        assert evaluate_condition(expression, context), f"Success criteria failed: {expression}"
+    if workflow.exit_check is None or not workflow.exit_check(context):
+        # Check success criteria
+        for expression, check in _checks(workflow.success_criteria, workflow.success_checks):
+            if not check(context):
+                raise AssertionError("Success criteria failed: %s" % expression)
 
-    # Check failure conditions
-    for expression in workflow.failure_conditions:
-        assert not evaluate_condition(expression, context), f"Failure condition met: {expression}"
+        # Check failure conditions
+        for expression, check in _checks(workflow.failure_conditions, workflow.failure_checks):
+            if check(context):
+                raise AssertionError("Failure condition met: %s" % expression)
 
     return {k: context.get(k) for k in workflow.outputs}
 
 
-def _indegree(wf: Workflow, node_id: str) -> int:
-    """Calculate the in-degree of a node."""
-    return sum(1 for e in wf.edges if e.dest == node_id)
+def _independent(layer: List[Node]) -> bool:
+    """True if no node in the layer reads a name another node in it writes."""
+    for node in layer:
+        written = {out for other in layer if other is not node for out in other.io_outputs}
+        if written.intersection(node.io_inputs):
+            return False
+    return True
+
+
+def _merge(node: Node, out: Dict[str, Any], context: Dict[str, Any],
+           out_edges: Dict[str, Any], pending: Counter, activated: set) -> None:
+    """Fold a node's outputs into the context, check its tests and activate successors."""
+    context.update(out)
+    for test, check in _checks(node.tests, node.test_checks, normalize):
+        if not check(context):
+            raise AssertionError("Test failed for node %s: %s" % (node.id, test))
+    
+    # Successors: all predecessors done and this edge's guard holds
+    for edge in out_edges.get(node.id, []):
+        pending[edge.dest] -= 1
+    for edge in out_edges.get(node.id, []):
+        when = edge.when_check or compile_condition(normalize(edge.when))
+        if pending[edge.dest] == 0 and when(context):
+            activated.add(edge.dest)
+
+
+def _run_node(node: Node, context: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the node's load-time bound step, building an agent only when there is none."""
+    step = node.step or make_agent(node).execute
+    return step(context)
+
+
+def _run_batched(layer: List[Node], context: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """
+    Run each group of two or more nodes that share a tool's batch_fn in a single
+    call. Returns outputs keyed by the node's index in the layer.
+    """
+    groups: Dict[Any, List[int]] = {}
+    for i, node in enumerate(layer):
+        batch_fn = TOOL_BATCH[node.tool_idx] if node.tool_idx is not None else None
+        if batch_fn is not None:
+            groups.setdefault(batch_fn, []).append(i)
+    
+    results: Dict[int, Dict[str, Any]] = {}
+    for batch_fn, indices in groups.items():
+        if len(indices) < 2:
+            continue
+        calls = [{k: context[k] for k in layer[i].io_inputs if k in context} for i in indices]
+        outputs = batch_fn(calls)
+        if len(outputs) != len(calls):
+            raise ValueError(f"batch_fn returned {len(outputs)} results for {len(calls)} calls")
+        for i, result in zip(indices, outputs):
+            results[i] = result if isinstance(result, dict) else {"result": result}
+    return results
+
+
+def _dry_run(workflow: Workflow, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Simulate every node in topological order without building agents or
+    evaluating guards; outputs get the same placeholders as BaseAgent.dry_run.
+    """
+    by_id = {n.id: n for n in workflow.nodes}
+    layers = workflow.layers if workflow.layers is not None else topological_layers(workflow)
+    context = dict(inputs)
+    for layer_ids in layers:
+        for node_id in layer_ids:
+            for out in by_id[node_id].io_outputs:
+                context[out] = f"{node_id}:{out}:DRY"
+    return {k: context.get(k) for k in workflow.outputs}
+
 
-def _normalize(expr: str) -> str:
-    # Allow tests like "email_id != null" in YAML
-    return expr.replace("null", "None")
\ No newline at end of file
+def _checks(expressions: List[str], checks: Optional[List[Check]],
+            prepare=None) -> Iterable[Tuple[str, Check]]:
+    """Pair expressions with their load-time predicates, compiling any that are missing."""
+    if checks is None:
+        checks = [compile_condition(prepare(e) if prepare else e) for e in expressions]
+    return zip(expressions, checks)
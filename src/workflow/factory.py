@@ -12,7 +12,8 @@ _AGENT_MAP: Dict[str, Type[BaseAgent]] = {
 }
 
 
-def make_agent(node):
+def make_agent(node, count: bool = True):
+    """Build the agent for a node; count=False skips the creation counter (used for load-time binding)."""
     # Handle special-case agent types that would cause import cycles by importing lazily
     if node.type == "workflow_call":
         from ..agents.workflow_call import WorkflowCallAgent
@@ -25,11 +26,15 @@ def make_agent(node):
 
     # instantiate and track creation count
     instance = cls(node.id, node.params, node.io_inputs, node.io_outputs, node.tests)
-    try:
-        # increment global counter if present
-        globals()['_AGENT_CREATION_COUNT'] += 1
-    except Exception:
-        globals()['_AGENT_CREATION_COUNT'] = 1
+    tool_idx = getattr(node, "tool_idx", None)
+    if tool_idx is not None:
+        instance.tool_idx = tool_idx
+    if count:
+        try:
+            # increment global counter if present
+            globals()['_AGENT_CREATION_COUNT'] += 1
+        except Exception:
+            globals()['_AGENT_CREATION_COUNT'] = 1
 
     return instance
 
@@ -1,5 +1,8 @@
 import ast
+import functools
 import operator
+from typing import Callable, Iterable, Optional
+from .predicates import Predicate, compile_predicate
 
 # _ALLOWED_OPERATORS = {
 #     "==": operator.eq,
@@ -12,64 +15,105 @@ import operator
 #     "or": lambda a, b: a or b
 # }
 
+_ALLOWED_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.Compare,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+    ast.Name, ast.Load, ast.Constant,
+)
+
 def evaluate_condition(expression: str, context: dict) -> bool:
     """
     Evaluate a guard expression in the provided context.
     """
-    expression = expression.strip().lower()
-    if expression in ("true", ""):  # Default to true
-        return True
+    return compile_condition(expression)(context)
+
+def compile_condition(expression: str) -> Callable[[dict], bool]:
+    """
+    Compile a guard once into a predicate over a context dict.
+    Expressions that fail to parse or validate compile to a predicate that is always false.
+    """
+    try:
+        predicate = _compile(expression)
+    except Exception:
+        return _always_false
+    if predicate is None:  # Default to true
+        return _always_true
+    return functools.partial(_call_safely, predicate)
+
+def compile_conjunction(required: Iterable[str], forbidden: Iterable[str] = ()) -> Callable[[dict], bool]:
+    """
+    Fuse guards into one predicate that holds when every required guard holds
+    and no forbidden guard does. A False result may be spurious (an error in any
+    clause fails the whole), so callers re-check clause by clause to find out
+    which one failed; a True result is exact.
+    """
+    clauses = []
+    for expression in required:
+        try:
+            tree = _parse(expression)
+        except Exception:
+            return _always_false  # an invalid required guard never holds
+        if tree is not None:
+            clauses.append(tree.body)
+    for expression in forbidden:
+        try:
+            tree = _parse(expression)
+        except Exception:
+            continue  # an invalid forbidden guard never holds either
+        if tree is None:
+            return _always_false
+        clauses.append(ast.UnaryOp(op=ast.Not(), operand=tree.body))
     
-    expression = expression.replace("&&", " and ").replace("||", " or ")
+    if not clauses:
+        return _always_true
+    body = clauses[0] if len(clauses) == 1 else ast.BoolOp(op=ast.And(), values=clauses)
+    tree = ast.fix_missing_locations(ast.Expression(body=body))
+    return functools.partial(_call_safely, compile_predicate(tree))
+
+def normalize(expression: str) -> str:
+    """Allow tests like "email_id != null" in YAML."""
+    return expression.replace("null", "None")
+
+def _call_safely(predicate: Predicate, context: dict) -> bool:
     try:
-        return bool(_safe_eval(expression, context))
+        return predicate(context)
     except Exception:
         return False
-    
-def _safe_eval(expression: str, context: dict) -> bool:
-    node = ast.parse(expression, mode='eval')
 
-    def _eval(node):
-        if isinstance(node, ast.Expression):
-            return _eval(node.body)
-        
-        if isinstance(node, ast.BoolOp):
-            values = [_eval(v) for v in node.values]
-            if isinstance(node.op, ast.And):
-                out = True
-                for v in values:
-                    out = out and v
-                return out
-            elif isinstance(node.op, ast.Or):
-                out = False
-                for v in values:
-                    out = out or v
-                return out
-            
-        if isinstance(node, ast.Compare):
-            left = _eval(node.left)
-            for op, comparator in zip(node.ops, node.comparators):
-                right = _eval(comparator)
-                if isinstance(op, ast.Eq):      ok = (left == right)
-                elif isinstance(op, ast.NotEq): ok = (left != right)
-                elif isinstance(op, ast.Lt):    ok = (left < right)
-                elif isinstance(op, ast.LtE):   ok = (left <= right)
-                elif isinstance(op, ast.Gt):    ok = (left > right)
-                elif isinstance(op, ast.GtE):   ok = (left >= right)
-                else:
-                    raise ValueError(f"Unsupported operator: {op}")
-                if not ok:
-                    return False
-                left = right
-            return True
-        
-        if isinstance(node, ast.Name):
-            return context[node.id]
-        if isinstance(node, ast.Constant):
-            return node.value
-        raise ValueError("Unsupported expression")
+def _always_true(context: dict) -> bool:
+    return True
+
+def _always_false(context: dict) -> bool:
+    return False
+
+@functools.lru_cache(maxsize=1024)
+def _compile(expression: str) -> Optional[Predicate]:
+    """
+    Compile a guard once per unique expression text.
+    Returns None for expressions that are always true.
+    """
+    tree = _parse(expression)
+    return None if tree is None else compile_predicate(tree)
+
+@functools.lru_cache(maxsize=1024)
+def _parse(expression: str) -> Optional[ast.Expression]:
+    """
+    Normalize, parse and whitelist a guard. Returns None for expressions that are
+    always true. The tree is shared between callers and must not be mutated.
+    """
+    expression = expression.strip().lower()
+    if expression in ("true", ""):
+        return None
     
-    return _eval(node)
+    expression = expression.replace("&&", " and ").replace("||", " or ")
+    tree = ast.parse(expression, mode='eval')
+    _validate(tree)
+    return tree
+
+def _validate(tree: ast.AST) -> None:
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported expression: {type(node).__name__}")
 
 # Alias for backward compatibility
 eval_guard = evaluate_condition
\ No newline at end of file
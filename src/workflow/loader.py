@@ -11,8 +11,32 @@ import yaml
 from ..meta_agent import Task, DecompositionResult, AbstractTaskDecomposer
 from ..meta_agent import TaskVerifier, ResultCombiner
 import collections
+import operator
+import os
+import re
 from .schema import validate_workflow
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Validated specs keyed by path, each stored with the (mtime, size) it was read at so
+# unchanged files skip parse + validation and a changed file replaces its own entry
+_SPEC_CACHE: Dict[str, tuple] = {}
+
+# Fast classifier for len(var) <op> N guards: one regex match instead of a substring/split cascade
+_GUARD_RE = re.compile(r"^len\(\s*(\w+)\s*\)\s*(==|!=|>=|<=|>|<)\s*(-?\d+)\s*$")
+_LEN_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
 
 def _eval_simple_condition(cond: str, context: Dict[str, Any]) -> bool:
     """Evaluate a small set of guard expressions safely.
@@ -25,55 +49,23 @@ def _eval_simple_condition(cond: str, context: Dict[str, Any]) -> bool:
     Falls back to a restricted eval for simple expressions.
     """
     cond = cond.strip()
-    # very small parser for common len(...) patterns
-    if cond.startswith("len("):
-        # allow forms like len(numbers) == 2 or len(numbers) > 2
-        try:
-            left, op, right = None, None, None
-            if "==" in cond:
-                left, right = cond.split("==")
-                op = "=="
-            elif ">=" in cond:
-                left, right = cond.split(">=")
-                op = ">="
-            elif "<=" in cond:
-                left, right = cond.split("<=")
-                op = "<="
-            elif ">" in cond:
-                left, right = cond.split(">")
-                op = ">"
-            elif "<" in cond:
-                left, right = cond.split("<")
-                op = "<"
-            else:
-                return False
-            left = left.strip()
-            right = right.strip()
-            # expect left like len(numbers)
-            if left.startswith("len(") and left.endswith(")"):
-                var = left[4:-1].strip()
-                if var not in context:
-                    return False
-                # Only evaluate length checks for list-like objects. If the value is
-                # a placeholder string (e.g. 'left' used to refer to another output),
-                # treat the condition as unknown/false so we don't mis-evaluate it.
-                actual = context.get(var)
-                if not isinstance(actual, (list, tuple)):
-                    return False
-                val = len(actual)
-                rval = int(right)
-                if op == "==":
-                    return val == rval
-                if op == ">":
-                    return val > rval
-                if op == "<":
-                    return val < rval
-                if op == ">=":
-                    return val >= rval
-                if op == "<=":
-                    return val <= rval
-        except Exception:
+    # very small parser for common len(...) patterns, e.g. len(numbers) == 2
+    m = _GUARD_RE.match(cond)
+    if m:
+        var, op, rval = m.group(1), m.group(2), int(m.group(3))
+        if var not in context:
             return False
+        # Only evaluate length checks for list-like objects. If the value is
+        # a placeholder string (e.g. 'left' used to refer to another output),
+        # treat the condition as unknown/false so we don't mis-evaluate it.
+        actual = context.get(var)
+        if not isinstance(actual, (list, tuple)):
+            return False
+        return _LEN_OPS[op](len(actual), rval)
+    if cond.startswith("len("):
+        # a len() guard we can't classify must not reach eval, where it would
+        # measure placeholder strings
+        return False
     # fallback: try eval with restricted locals
     try:
         allowed_locals = {k: v for k, v in context.items()}
@@ -101,6 +93,15 @@ class YamlTaskDecomposer(AbstractTaskDecomposer):
             if node.get("type") == "decision":
                 self.decision_node = node
                 break
+        # Edges resolved once into (src, dst, when) tuples, accepting both from/to and src/dest keys
+        self._edges: List[tuple] = [
+            (e.get('from') or e.get('src'), e.get('to') or e.get('dest'), e.get('when', 'true'))
+            for e in self.spec.get('edges', [])
+        ]
+        # The spec is immutable after construction, so the engine-style topological
+        # order and incoming guards are derived lazily once and reused per decomposition.
+        self._ordered_nodes: Optional[List[Dict[str, Any]]] = None
+        self._incoming_by_id: Dict[Any, List[str]] = {}
 
     def decompose(self, task: Task, depth: int) -> DecompositionResult:
         # If no decision node, fallback to no decomposition
@@ -109,7 +110,7 @@ class YamlTaskDecomposer(AbstractTaskDecomposer):
             # to a sub-task and return a hierarchical decomposition. This enables
             # MetaAgent-driven lazy execution of engine-style workflows.
             if self.spec.get("nodes") and self.spec.get("edges") is not None:
-                sub_tasks = self._nodes_to_tasks(self.spec.get("nodes", []), parent_id=task.id, root_inputs=task.inputs)
+                sub_tasks = self._nodes_to_tasks(parent_id=task.id, root_inputs=task.inputs)
                 return DecompositionResult(
                     sub_tasks=sub_tasks,
                     decomposition_strategy="hierarchical",
@@ -142,10 +143,12 @@ class YamlTaskDecomposer(AbstractTaskDecomposer):
                     # map simple strings like "[]" or "numbers" into actual values
                     resolved = {}
                     for k, v in outputs.items():
-                        if isinstance(v, str) and v.strip() == "[]":
+                        # strip() once; on already-normalized YAML tokens it returns the same object
+                        ref = v.strip() if isinstance(v, str) else None
+                        if ref == "[]":
                             resolved[k] = []
-                        elif isinstance(v, str) and v.strip() in context:
-                            resolved[k] = context.get(v.strip())
+                        elif ref is not None and ref in context:
+                            resolved[k] = context[ref]
                         else:
                             resolved[k] = v
                     task.result = resolved
@@ -229,13 +232,10 @@ class YamlTaskDecomposer(AbstractTaskDecomposer):
                 params=params,
                 is_atomic=is_atomic,
                 verification_criteria=node.get("tests", []),
-                parent_id=parent_id
+                parent_id=parent_id,
+                # declared outputs mapping (parent_key -> child_key)
+                outputs=outputs
             )
-            # store declared outputs mapping (parent_key -> child_key)
-            try:
-                task.outputs = outputs
-            except Exception:
-                task.outputs = {}
             # debug visibility when running examples
             try:
                 print(f"[LOADER] created task {nid} inputs={inputs}")
@@ -244,42 +244,57 @@ class YamlTaskDecomposer(AbstractTaskDecomposer):
             tasks.append(task)
         return tasks
 
-    def _nodes_to_tasks(self, nodes: List[Dict[str, Any]], parent_id: str, root_inputs: Optional[Dict[str, Any]] = None) -> List[Task]:
-        """Convert engine-style nodes into Task objects in topological order.
+    def _topology(self) -> List[Dict[str, Any]]:
+        """Return engine-style nodes in topological order, computing it on first use.
 
-        This is a lightweight mapper: it preserves node ids, descriptions, and io
-        declarations. Inputs are resolved from root_inputs when possible; otherwise
-        left as None/placeholders. Execution order is topologically sorted using
-        edges declared in the spec.
+        Execution order is topologically sorted using edges declared in the spec;
+        without edges the original node order is kept. Incoming guard conditions
+        per node id are collected alongside.
         """
+        if self._ordered_nodes is not None:
+            return self._ordered_nodes
+
+        nodes = self.spec.get('nodes', [])
         # Build id->node map
         id_map = {n.get('id'): n for n in nodes}
 
         # If edges exist in the spec, use them to topologically sort; else keep original order
-        edges = self.spec.get('edges', [])
-        if edges:
+        incoming: Dict[Any, List[str]] = {}
+        if self._edges:
             # Build adjacency and indegree
             indegree = {nid: 0 for nid in id_map}
             adj = {nid: [] for nid in id_map}
-            for e in edges:
-                src = e.get('from') or e.get('src')
-                dst = e.get('to') or e.get('dest')
+            for src, dst, when in self._edges:
+                incoming.setdefault(dst, []).append(when)
                 if src in id_map and dst in id_map:
                     adj[src].append(dst)
                     indegree[dst] = indegree.get(dst, 0) + 1
 
             # Kahn's algorithm
-            queue = [nid for nid, deg in indegree.items() if deg == 0]
+            queue = collections.deque(nid for nid, deg in indegree.items() if deg == 0)
             ordered = []
             while queue:
-                cur = queue.pop(0)
+                cur = queue.popleft()
                 ordered.append(id_map[cur])
                 for nb in adj.get(cur, []):
                     indegree[nb] -= 1
                     if indegree[nb] == 0:
                         queue.append(nb)
         else:
-            ordered = nodes
+            ordered = list(nodes)
+
+        self._incoming_by_id = incoming
+        self._ordered_nodes = ordered
+        return ordered
+
+    def _nodes_to_tasks(self, parent_id: str, root_inputs: Optional[Dict[str, Any]] = None) -> List[Task]:
+        """Convert engine-style nodes into Task objects in topological order.
+
+        This is a lightweight mapper: it preserves node ids, descriptions, and io
+        declarations. Inputs are resolved from root_inputs when possible; otherwise
+        left as None/placeholders.
+        """
+        ordered = self._topology()
 
         tasks: List[Task] = []
         for node in ordered:
@@ -303,12 +318,11 @@ class YamlTaskDecomposer(AbstractTaskDecomposer):
                 inputs=inputs,
                 is_atomic=is_atomic,
                 verification_criteria=tests,
-                parent_id=parent_id
+                parent_id=parent_id,
+                # declared outputs and incoming guard conditions for runtime use
+                io_outputs=io.get('outputs', []),
+                guard_conditions=list(self._incoming_by_id.get(nid, ()))
             )
-            # attach declared outputs and incoming guard conditions for runtime use
-            task.io_outputs = io.get('outputs', [])
-            incoming = [e for e in self.spec.get('edges', []) if (e.get('to') or e.get('dest')) == nid]
-            task.guard_conditions = [e.get('when', 'true') for e in incoming]
             tasks.append(task)
 
         return tasks
@@ -322,18 +336,7 @@ def load_yaml_to_meta_agent(yaml_path: str):
     The returned `root_task` should be passed to `MetaAgent.solve(root_task)` with a
     MetaAgent constructed using the returned decomposer.
     """
-    with open(yaml_path, "r") as fh:
-        parsed_raw = yaml.safe_load(fh)
-    # Validate and coerce via pydantic models; if validation fails, raise a
-    # clear error. validate_workflow returns (model, dict).
-    try:
-        # Validate YAML but keep the original raw dict for downstream logic to
-        # avoid subtle structural changes from model->dict conversion.
-        _, _ = validate_workflow(parsed_raw)
-        parsed = parsed_raw
-    except Exception:
-        # If validation fails, re-raise so caller sees a helpful message
-        raise
+    parsed = _load_validated_spec(yaml_path)
 
     # Create a top-level Task representing the workflow invocation
     name = parsed.get("name", "workflow")
@@ -353,6 +356,111 @@ def load_yaml_to_meta_agent(yaml_path: str):
     return root, decomposer, verifier, combiner
 
 
+def _load_validated_spec(yaml_path: str) -> Dict[str, Any]:
+    """Parse and validate a YAML spec, reusing the result while the file is unchanged.
+
+    The cached dict is shared between callers and must be treated as read-only.
+    """
+    st = os.stat(yaml_path)
+    key = os.path.abspath(yaml_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _SPEC_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(yaml_path, "r") as fh:
+        parsed_raw = yaml.load(fh, Loader=_SafeLoader)
+    # Validate and coerce via pydantic models; if validation fails, raise a
+    # clear error. validate_workflow returns (model, dict).
+    # Validate YAML but keep the original raw dict for downstream logic to
+    # avoid subtle structural changes from model->dict conversion.
+    _, _ = validate_workflow(parsed_raw)
+    _SPEC_CACHE[key] = (stamp, parsed_raw)
+    return parsed_raw
+
+
+class _ConcatenateCombiner:
+    """Concatenate list outputs from sub-results into a single list under out_key."""
+    # Sub-results are almost always plain dicts: the exact type(...) is checks are
+    # tried first and isinstance only runs for subclasses or other types.
+    __slots__ = ("left_key", "right_key", "out_key")
+
+    def __init__(self, left_key, right_key, out_key):
+        self.left_key = left_key
+        self.right_key = right_key
+        self.out_key = out_key
+
+    def _find_list_by_key(self, key, sub_results):
+        for r in sub_results:
+            res = r.get('result') or {}
+            if (type(res) is dict or isinstance(res, dict)) and key in res and isinstance(res[key], list):
+                return res[key]
+        return None
+
+    def _find_two_lists(self, sub_results):
+        lists = []
+        for r in sub_results:
+            res = r.get('result') or {}
+            if type(res) is dict or isinstance(res, dict):
+                for k, v in res.items():
+                    if type(v) is list or isinstance(v, list):
+                        lists.append((k, v))
+            elif isinstance(res, list):
+                lists.append((None, res))
+        return lists
+
+    def combine(self, task: Task, sub_tasks: List[Task], sub_results: List[Dict[str, Any]], recombination_plan: str):
+        # If any sub-result already provides the final output (e.g. merge tool), prefer it.
+        # Prefer the final sub-result that provides the desired out_key (e.g., merge tool -> final sorted list)
+        for r in reversed(sub_results):
+            res = r.get('result') or {}
+            if (type(res) is dict or isinstance(res, dict)) and self.out_key in res and isinstance(res[self.out_key], list):
+                return {self.out_key: res[self.out_key]}
+
+        left = None
+        right = None
+        if self.left_key and self.right_key:
+            left = self._find_list_by_key(self.left_key, sub_results)
+            right = self._find_list_by_key(self.right_key, sub_results)
+
+        # collected once and reused by both the named-key and positional fallbacks
+        lists = self._find_two_lists(sub_results)
+
+        if left is None or right is None:
+            name_map = dict(lists)
+            # prefer named keys
+            for candidate in ('left_sorted', 'left'):
+                if candidate in name_map and left is None:
+                    left = name_map[candidate]
+            for candidate in ('right_sorted', 'right'):
+                if candidate in name_map and right is None:
+                    right = name_map[candidate]
+
+            if (left is None or right is None) and len(lists) >= 2:
+                if left is None:
+                    left = lists[0][1]
+                if right is None:
+                    right = lists[1][1]
+
+        if (left is None or right is None):
+            for r in sub_results:
+                res = r.get('result') or {}
+                if type(res) is dict or isinstance(res, dict):
+                    if left is None and 'left' in res and isinstance(res['left'], list):
+                        left = res['left']
+                    if right is None and 'right' in res and isinstance(res['right'], list):
+                        right = res['right']
+
+        combined_list = []
+        if left and right:
+            combined_list = list(left) + list(right)
+        else:
+            for _, v in lists:
+                combined_list.extend(v)
+
+        return {self.out_key: combined_list}
+
+
 def _build_combiner_from_spec(parsed: Dict[str, Any]):
     """Create a combiner instance based on YAML spec.
 
@@ -367,82 +475,7 @@ def _build_combiner_from_spec(parsed: Dict[str, Any]):
         left_key = spec.get('left_key')
         right_key = spec.get('right_key')
         out_key = spec.get('output_key', 'sorted_numbers')
-
-        class ConcatenateCombiner:
-            def __init__(self, left_key, right_key, out_key):
-                self.left_key = left_key
-                self.right_key = right_key
-                self.out_key = out_key
-
-            def _find_list_by_key(self, key, sub_results):
-                for r in sub_results:
-                    res = r.get('result') or {}
-                    if isinstance(res, dict) and key in res and isinstance(res[key], list):
-                        return res[key]
-                return None
-
-            def _find_two_lists(self, sub_results):
-                lists = []
-                for r in sub_results:
-                    res = r.get('result') or {}
-                    if isinstance(res, dict):
-                        for k, v in res.items():
-                            if isinstance(v, list):
-                                lists.append((k, v))
-                    elif isinstance(res, list):
-                        lists.append((None, res))
-                return lists
-
-            def combine(self, task: Task, sub_tasks: List[Task], sub_results: List[Dict[str, Any]], recombination_plan: str):
-                # If any sub-result already provides the final output (e.g. merge tool), prefer it.
-                # Prefer the final sub-result that provides the desired out_key (e.g., merge tool -> final sorted list)
-                for r in reversed(sub_results):
-                    res = r.get('result') or {}
-                    if isinstance(res, dict) and self.out_key in res and isinstance(res[self.out_key], list):
-                        return {self.out_key: res[self.out_key]}
-
-                left = None
-                right = None
-                if self.left_key and self.right_key:
-                    left = self._find_list_by_key(self.left_key, sub_results)
-                    right = self._find_list_by_key(self.right_key, sub_results)
-
-                if left is None or right is None:
-                    lists = self._find_two_lists(sub_results)
-                    name_map = {k: v for k, v in lists}
-                    # prefer named keys
-                    for candidate in ('left_sorted', 'left'):
-                        if candidate in name_map and left is None:
-                            left = name_map[candidate]
-                    for candidate in ('right_sorted', 'right'):
-                        if candidate in name_map and right is None:
-                            right = name_map[candidate]
-
-                    if (left is None or right is None) and len(lists) >= 2:
-                        if left is None:
-                            left = lists[0][1]
-                        if right is None:
-                            right = lists[1][1]
-
-                if (left is None or right is None):
-                    for r in sub_results:
-                        res = r.get('result') or {}
-                        if isinstance(res, dict):
-                            if left is None and 'left' in res and isinstance(res['left'], list):
-                                left = res['left']
-                            if right is None and 'right' in res and isinstance(res['right'], list):
-                                right = res['right']
-
-                combined_list = []
-                if left and right:
-                    combined_list = list(left) + list(right)
-                else:
-                    for _, v in self._find_two_lists(sub_results):
-                        combined_list.extend(v)
-
-                return {out_key: combined_list}
-
-        return ConcatenateCombiner(left_key, right_key, out_key)
+        return _ConcatenateCombiner(left_key, right_key, out_key)
 
     # fallback
     return ResultCombiner()
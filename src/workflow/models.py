@@ -1,15 +1,19 @@
 """ Data models for workflow representation """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Callable, List, Optional, Tuple, Dict, Any
 
-@dataclass
+# Predicate compiled from a guard expression at load time
+Check = Callable[[Dict[str, Any]], bool]
+
+@dataclass(slots=True)
 class Edge:
     src: str
     dest: str
     when: str = "true" # default boolean condition expression
+    when_check: Optional[Check] = field(default=None, repr=False, compare=False)
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     id: str
     type: str
@@ -18,8 +22,11 @@ class Node:
     io_inputs: List[str] = field(default_factory=list)
     io_outputs: List[str] = field(default_factory=list)
     tests: List[str] = field(default_factory=list)
+    test_checks: Optional[List[Check]] = field(default=None, repr=False, compare=False)
+    tool_idx: Optional[int] = field(default=None, repr=False, compare=False)  # registry slot, resolved at load time
+    step: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = field(default=None, repr=False, compare=False)  # bound agent.execute
 
-@dataclass
+@dataclass(slots=True)
 class Workflow:
     name: str
     description: str = ""
@@ -29,4 +36,10 @@ class Workflow:
     inputs: List[str] = field(default_factory=list)
     outputs: List[str] = field(default_factory=list)
     nodes: List[Node] = field(default_factory=list)
-    edges: List[Edge] = field(default_factory=list)
\ No newline at end of file
+    edges: List[Edge] = field(default_factory=list)
+    precondition_checks: Optional[List[Check]] = field(default=None, repr=False, compare=False)
+    success_checks: Optional[List[Check]] = field(default=None, repr=False, compare=False)
+    failure_checks: Optional[List[Check]] = field(default=None, repr=False, compare=False)
+    entry_check: Optional[Check] = field(default=None, repr=False, compare=False)  # all preconditions, fused
+    exit_check: Optional[Check] = field(default=None, repr=False, compare=False)  # success and not failure, fused
+    layers: Optional[List[List[str]]] = field(default=None, repr=False, compare=False)  # Kahn layers of node ids
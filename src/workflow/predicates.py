@@ -0,0 +1,95 @@
+""" Compile guard expressions into closures over a context dict. """
+
+import ast
+import operator
+from typing import Any, Callable, Dict, Union
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+_COMPARE_OPS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def compile_predicate(expr: Union[str, ast.Expression]) -> Predicate:
+    """
+    Parse an expression once and return a predicate built from nested closures.
+    Comparisons, and/or/not, names and constants are walked directly; anything else
+    falls back to eval of the compiled expression. Unknown names raise NameError,
+    as eval would.
+    """
+    tree = ast.parse(expr, mode="eval") if isinstance(expr, str) else expr
+    try:
+        fn = _build(tree.body)
+    except _Unsupported:
+        code = compile(tree, "<predicate>", "eval")
+        return lambda context: bool(eval(code, {"__builtins__": {}}, context))
+    return lambda context: bool(fn(context))
+
+
+def _build(node: ast.AST) -> Callable[[Dict[str, Any]], Any]:
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda context: value
+
+    if isinstance(node, ast.Name):
+        key = node.id
+        def lookup(context):
+            try:
+                return context[key]
+            except KeyError:
+                raise NameError(f"name {key!r} is not defined") from None
+        return lookup
+
+    if isinstance(node, ast.Compare):
+        ops = [_COMPARE_OPS.get(type(op)) for op in node.ops]
+        if None in ops:
+            raise _Unsupported(type(node.ops[ops.index(None)]).__name__)
+        left = _build(node.left)
+        rights = [_build(c) for c in node.comparators]
+        if len(ops) == 1:
+            op, right = ops[0], rights[0]
+            return lambda context: op(left(context), right(context))
+        pairs = list(zip(ops, rights))
+        def chain(context):
+            lhs = left(context)
+            for op, right in pairs:
+                rhs = right(context)
+                if not op(lhs, rhs):
+                    return False
+                lhs = rhs
+            return True
+        return chain
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand = _build(node.operand)
+        return lambda context: not operand(context)
+
+    if isinstance(node, ast.BoolOp):
+        fns = [_build(v) for v in node.values]
+        if isinstance(node.op, ast.And):
+            def all_of(context):
+                for fn in fns:
+                    value = fn(context)
+                    if not value:
+                        return value
+                return value
+            return all_of
+        def any_of(context):
+            for fn in fns:
+                value = fn(context)
+                if value:
+                    return value
+            return value
+        return any_of
+
+    raise _Unsupported(type(node).__name__)
@@ -1,6 +1,11 @@
 from typing import List, Optional, Dict, Any, Tuple
 from pydantic import BaseModel, Field, ValidationError
 
+try:                                    # v2
+    from pydantic import TypeAdapter
+except ImportError:                     # v1
+    TypeAdapter = None
+
 
 # Unused at the moment
 class Guard(BaseModel):
@@ -52,21 +57,26 @@ class WorkflowSpec(BaseModel):
         extra = "forbid"  # Unexpected keys in the YAML (we might want to allow this)
 
 
+# support for both pydantic v2 and v1, resolved once at import time
+_IS_V2 = hasattr(WorkflowSpec, "model_validate")
+
+if _IS_V2:
+    # Built once; reusing the adapter avoids rebuilding the validator per load
+    _validate = TypeAdapter(WorkflowSpec).validate_python
+    _dump = lambda m: m.model_dump()
+else:
+    _validate = WorkflowSpec.parse_obj
+    _dump = lambda m: m.dict()
+
+
 def _model_to_dict(model: BaseModel) -> Dict[str, Any]:
-    # support for both pydantic v2 and v1
-    if hasattr(model, "model_dump"):   # v2
-        return model.model_dump()
-    return model.dict()                # v1
+    return _dump(model)
 
 
 def validate_workflow(raw: Dict[str, Any]) -> Tuple[WorkflowSpec, Dict[str, Any]]:
     """Validate a raw YAML dict against WorkflowSpec."""
     try:
-        if hasattr(WorkflowSpec, "model_validate"):     # v2
-            spec = WorkflowSpec.model_validate(raw)
-        else:                                           # v1
-            spec = WorkflowSpec.parse_obj(raw)
-        return spec, _model_to_dict(spec)
+        spec = _validate(raw)
+        return spec, _dump(spec)
     except ValidationError as e:
         raise ValueError(f"YAML validation error: {e}")
-    
\ No newline at end of file
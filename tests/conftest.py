@@ -0,0 +1,14 @@
+"""Shared pytest fixtures."""
+
+import pytest
+from src.workflow.loader import load_yaml_to_meta_agent
+
+
+@pytest.fixture(scope="session")
+def sorting_spec():
+    """Load the sorting workflow once per session.
+
+    Returns (root, decomposer, verifier, combiner). The agents are stateless
+    between runs and can be shared; tests must `clone()` `root` before solving it.
+    """
+    return load_yaml_to_meta_agent('specs/yaml/sorting.yaml')
@@ -15,6 +15,56 @@ def tool_increment(value: int) -> dict:
     return {"incremented": value + 1}
 
 
+_PURE_CALLS = []
+
+
+@register_tool("test.pure_square", pure=True)
+def tool_pure_square(value: int, extra: dict = None) -> dict:
+    """Pure test tool that records how often it really runs."""
+    _PURE_CALLS.append(value)
+    return {"squared": value * value, "seen": [value]}
+
+
+def test_pure_tool_results_are_memoized():
+    """Pure tools run once per distinct argument set and hand out copies."""
+    agent = ToolAgent("sq", {"tool": "test.pure_square"}, ["value", "extra"], ["squared"])
+
+    first = agent.execute({"value": 3, "extra": {"k": [1]}})
+    first["seen"].append("mutated")
+    second = agent.execute({"value": 3, "extra": {"k": [1]}})
+    third = agent.execute({"value": 4, "extra": {"k": [1]}})
+
+    assert second == {"squared": 9, "seen": [3]}
+    assert third["squared"] == 16
+    assert _PURE_CALLS == [3, 4]
+
+
+@register_tool("test.subtract", positional=True)
+def tool_subtract(a, b) -> dict:
+    """Positional test tool; argument order follows io.inputs."""
+    return {"difference": a - b}
+
+
+def test_positional_tool_follows_input_order():
+    """Positional tools receive inputs in io.inputs order, whatever their names."""
+    agent = ToolAgent("sub", {"tool": "test.subtract"}, ["minuend", "subtrahend"], ["difference"])
+
+    assert agent.execute({"subtrahend": 3, "minuend": 10}) == {"difference": 7}
+
+
+@register_tool("test.halve", positional=True, out_param=True)
+def tool_halve(out, value) -> None:
+    """Out-param test tool; writes its result into the dict it is handed."""
+    out["halved"] = value / 2
+
+
+def test_out_param_tool_fills_output_dict():
+    """Out-param tools write into a fresh dict that becomes the agent's result."""
+    agent = ToolAgent("half", {"tool": "test.halve"}, ["value"], ["halved"])
+
+    assert agent.execute({"value": 9}) == {"halved": 4.5}
+
+
 def test_base_agent_is_abstract():
     """Test that BaseAgent cannot be instantiated directly."""
     # BaseAgent is abstract and requires execute() implementation
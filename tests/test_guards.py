@@ -1,134 +1,78 @@
 """Tests for guard/condition evaluation."""
 
 import pytest
-from src.workflow.guards import evaluate_condition, evaluate_condition
-
-
-def test_evaluate_condition_simple_equality():
-    """Test simple equality checks."""
-    context = {"x": 5, "y": 10}
-    
-    assert evaluate_condition("x == 5", context) is True
-    assert evaluate_condition("x == 10", context) is False
-    assert evaluate_condition("y == 10", context) is True
-
-
-def test_evaluate_condition_inequality():
-    """Test inequality operators."""
-    context = {"value": 42}
-    
-    assert evaluate_condition("value != 0", context) is True
-    assert evaluate_condition("value != 42", context) is False
-
-
-def test_evaluate_condition_comparisons():
-    """Test comparison operators (<, >, <=, >=)."""
-    context = {"score": 75}
-    
-    assert evaluate_condition("score > 50", context) is True
-    assert evaluate_condition("score < 100", context) is True
-    assert evaluate_condition("score >= 75", context) is True
-    assert evaluate_condition("score <= 75", context) is True
-    assert evaluate_condition("score > 100", context) is False
-
-
-def test_evaluate_condition_boolean_and():
-    """Test AND logic."""
-    context = {"a": True, "b": True, "c": False}
-    
-    assert evaluate_condition("a and b", context) is True
-    assert evaluate_condition("a and c", context) is False
-    assert evaluate_condition("b and c", context) is False
-
-
-def test_evaluate_condition_boolean_or():
-    """Test OR logic."""
-    context = {"a": True, "b": False, "c": False}
-    
-    assert evaluate_condition("a or b", context) is True
-    assert evaluate_condition("b or c", context) is False
-    assert evaluate_condition("a or c", context) is True
-
-
-def test_evaluate_condition_combined_conditions():
-    """Test combined conditions with AND/OR."""
-    context = {"x": 10, "y": 20, "valid": True}
-    
-    assert evaluate_condition("x < y and valid", context) is True
-    assert evaluate_condition("x > y or valid", context) is True
-    assert evaluate_condition("x > y and valid", context) is False
-
-
-def test_evaluate_condition_string_comparison():
-    """Test string comparisons."""
-    context = {"status": "approved", "type": "refund"}
-    
-    assert evaluate_condition("status == 'approved'", context) is True
-    assert evaluate_condition("status == 'rejected'", context) is False
-    assert evaluate_condition("type != 'charge'", context) is True
-
-
-def test_evaluate_condition_always_true():
-    """Test that 'true' or empty string evaluates to True."""
-    context = {}
-    
-    assert evaluate_condition("true", context) is True
-    assert evaluate_condition("", context) is True
-    assert evaluate_condition("  ", context) is True
-
-
-def test_evaluate_condition_with_none_values():
-    """Test handling of None values."""
-    context = {"value": None, "other": 42, "none": None}
-    
-    # Note: expression gets lowercased, so 'None' becomes 'none' which must be in context
-    assert evaluate_condition("value == none", context) is True
-    assert evaluate_condition("other != none", context) is True
-
-
-def test_evaluate_condition_boolean_values():
-    """Test direct boolean values."""
-    context = {"flag": True, "disabled": False}
-    
-    # Note: Direct boolean evaluation might need special handling
-    # Depending on implementation, this might not work as expected
-    # Test the actual behavior
-
-
-def test_evaluate_condition_invalid_expression_returns_false():
-    """Test that invalid expressions return False rather than crashing."""
-    context = {"x": 5}
-    
-    # These should not crash, just return False
-    result = evaluate_condition("undefined_var == 5", context)
-    # Depending on implementation, might be False or raise KeyError
-
-
-def test_evaluate_condition_nested_dict_access():
-    """Test accessing nested dictionary values."""
-    context = {
-        "user": {"id": 123, "role": "admin"},
-        "order": {"status": "completed"}
-    }
-    
-    # This might require special handling in the guard implementation
-    # For now, test what's currently supported
-
-
-def test_evaluate_condition_alias():
-    """Test that evaluate_condition is an alias for evaluate_condition."""
-    context = {"x": 5}
-    
-    result1 = evaluate_condition("x == 5", context)
-    result2 = evaluate_condition("x == 5", context)
-    
-    assert result1 == result2
-
-
-def test_evaluate_condition_chained_comparisons():
-    """Test chained comparison expressions."""
-    context = {"value": 50}
-    
-    # Python allows: 0 < value < 100
-    assert evaluate_condition("value > 0", context) is True
-    assert evaluate_condition("value < 100", context) is True
+from src.workflow.guards import compile_conjunction, evaluate_condition, eval_guard
+
+
+CASES = [
+    # simple equality
+    ("x == 5", {"x": 5, "y": 10}, True),
+    ("x == 10", {"x": 5, "y": 10}, False),
+    ("y == 10", {"x": 5, "y": 10}, True),
+    # inequality
+    ("value != 0", {"value": 42}, True),
+    ("value != 42", {"value": 42}, False),
+    # comparisons (<, >, <=, >=)
+    ("score > 50", {"score": 75}, True),
+    ("score < 100", {"score": 75}, True),
+    ("score >= 75", {"score": 75}, True),
+    ("score <= 75", {"score": 75}, True),
+    ("score > 100", {"score": 75}, False),
+    # chained comparisons
+    ("value > 0", {"value": 50}, True),
+    ("value < 100", {"value": 50}, True),
+    # AND logic
+    ("a and b", {"a": True, "b": True, "c": False}, True),
+    ("a and c", {"a": True, "b": True, "c": False}, False),
+    ("b and c", {"a": True, "b": True, "c": False}, False),
+    # OR logic
+    ("a or b", {"a": True, "b": False, "c": False}, True),
+    ("b or c", {"a": True, "b": False, "c": False}, False),
+    ("a or c", {"a": True, "b": False, "c": False}, True),
+    # combined AND/OR
+    ("x < y and valid", {"x": 10, "y": 20, "valid": True}, True),
+    ("x > y or valid", {"x": 10, "y": 20, "valid": True}, True),
+    ("x > y and valid", {"x": 10, "y": 20, "valid": True}, False),
+    # string comparisons
+    ("status == 'approved'", {"status": "approved", "type": "refund"}, True),
+    ("status == 'rejected'", {"status": "approved", "type": "refund"}, False),
+    ("type != 'charge'", {"status": "approved", "type": "refund"}, True),
+    # 'true' or empty string defaults to True
+    ("true", {}, True),
+    ("", {}, True),
+    ("  ", {}, True),
+    # None values: expression gets lowercased, so 'None' becomes 'none' which must be in context
+    ("value == none", {"value": None, "other": 42, "none": None}, True),
+    ("other != none", {"value": None, "other": 42, "none": None}, True),
+    # invalid expressions return False rather than crashing
+    ("undefined_var == 5", {"x": 5}, False),
+]
+
+
+@pytest.mark.parametrize("expr,ctx,expected", CASES)
+def test_evaluate_condition(expr, ctx, expected):
+    assert evaluate_condition(expr, ctx) is expected
+
+
+def test_eval_guard_alias():
+    """Test that eval_guard is a backward-compatible alias for evaluate_condition."""
+    assert eval_guard is evaluate_condition
+
+
+
+CONJUNCTION_CASES = [
+    (["x > 0", "y > 0"], [], {"x": 1, "y": 2}, True),
+    (["x > 0", "y > 0"], [], {"x": 1, "y": -2}, False),
+    (["x > 0"], ["y > 5"], {"x": 1, "y": 2}, True),
+    (["x > 0"], ["y > 5"], {"x": 1, "y": 9}, False),
+    ([], [], {}, True),
+    # a missing name fails the fused check; callers fall back to per-clause checks
+    (["x > 0"], ["missing == 1"], {"x": 1}, False),
+    # an invalid required guard never holds
+    (["x ** 2 > 0"], [], {"x": 1}, False),
+]
+
+
+@pytest.mark.parametrize("required,forbidden,ctx,expected", CONJUNCTION_CASES)
+def test_compile_conjunction(required, forbidden, ctx, expected):
+    assert compile_conjunction(required, forbidden)(ctx) is expected
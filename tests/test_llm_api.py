@@ -1,9 +1,23 @@
 # tests/test_llm_api.py
 import pytest
-from src import llm_api
 
 
-def test_interpret_human_spec_to_intermediate_parses_and_extracts_clarifications():
+@pytest.fixture(scope="session")
+def llm_api():
+    """Import the LLM pipeline lazily so collection does not pay for it."""
+    from src import llm_api
+    return llm_api
+
+
+@pytest.fixture(scope="module")
+def canned(llm_api):
+    """Intermediate markdown and YAML from the deterministic stub, generated once per module."""
+    interm = llm_api.interpret_human_spec_to_intermediate("seed").content_md
+    yaml_text = llm_api.generate_yaml_from_intermediate(interm).yaml_text
+    return interm, yaml_text
+
+
+def test_interpret_human_spec_to_intermediate_parses_and_extracts_clarifications(llm_api):
     human = (
         "When a customer requests a refund, check within 30 days. "
         "If accidental download, require approval. Email customer and log."
@@ -21,7 +35,7 @@ def test_interpret_human_spec_to_intermediate_parses_and_extracts_clarifications
     assert "Customer notification template/content not specified." in result.clarifications
 
 
-def test_generate_yaml_from_intermediate_returns_yaml_and_warnings():
+def test_generate_yaml_from_intermediate_returns_yaml_and_warnings(llm_api):
     # Use the intermediate markdown produced by the stub
     interm = llm_api.interpret_human_spec_to_intermediate("whatever").content_md
 
@@ -31,10 +45,9 @@ def test_generate_yaml_from_intermediate_returns_yaml_and_warnings():
     assert "nodes:" in gen.yaml_text
 
 
-def test_validate_yaml_against_schema_success_and_failure():
+def test_validate_yaml_against_schema_success_and_failure(llm_api, canned):
     # Good YAML
-    interm = llm_api.interpret_human_spec_to_intermediate("ok").content_md
-    good_yaml = llm_api.generate_yaml_from_intermediate(interm).yaml_text
+    _, good_yaml = canned
 
     schema = {
         "required": ["name", "inputs", "nodes", "edges", "success_criteria", "failure_conditions"]
@@ -50,16 +63,32 @@ def test_validate_yaml_against_schema_success_and_failure():
     ok2, errors2 = llm_api.validate_yaml_against_schema(broken_yaml, schema)
     assert ok2 is False
     assert any("Missing required top-level field: name" in e for e in errors2)
+
+    # Unparseable text and non-mapping documents get their own errors
+    ok3, errors3 = llm_api.validate_yaml_against_schema("name: [unclosed", schema)
+    assert ok3 is False
+    assert errors3[0].startswith("Invalid YAML:")
+    assert llm_api.validate_yaml_against_schema("- just\n- a list\n", schema) == (
+        False, ["Top-level YAML must be a mapping."]
+    )
+
+    # Already-parsed specs skip the YAML step
+    import yaml
+    good = yaml.safe_load(good_yaml)
+    assert llm_api._validate_dict_against_schema(good, schema) == (True, [])
+    broken = {k: v for k, v in good.items() if k != "name"}
+    assert llm_api._validate_dict_against_schema(broken, schema) == (
+        False, ["Missing required top-level field: name"]
+    )
     # with open("specs/yaml/order_refund.yaml", "r") as f:
     #     yaml_text = f.read()
         # compare generated yaml to expected yaml
 
 
 
-def test_summarise_alignment_detects_missing_and_extra_keywords():
+def test_summarise_alignment_detects_missing_and_extra_keywords(llm_api, canned):
     human = "Refund request; check policy; email customer; write audit log."
-    interm = llm_api.interpret_human_spec_to_intermediate(human).content_md
-    yaml_text = llm_api.generate_yaml_from_intermediate(interm).yaml_text
+    interm, yaml_text = canned
 
     # Introduce an "extra" keyword into YAML not found in the human spec
     yaml_text += "\n# internal_reconciliation_job\n"
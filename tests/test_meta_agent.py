@@ -7,6 +7,20 @@ from src.meta_agent import (
 )
 
 
+@pytest.fixture
+def make_meta_agent():
+    """Factory building a MetaAgent with fresh default components."""
+    def _mk(**kwargs):
+        return MetaAgent(TaskDecomposer(), TaskExecutor(), TaskVerifier(), ResultCombiner(), **kwargs)
+    return _mk
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    """One TaskVerifier shared by the verifier tests; it only counts calls."""
+    return TaskVerifier()
+
+
 def test_task_creation():
     """Test basic task creation."""
     task = Task(
@@ -93,10 +107,8 @@ def test_task_executor_basic():
     assert executor.execution_count == 1
 
 
-def test_task_verifier_with_criteria():
+def test_task_verifier_with_criteria(verifier):
     """Test verification with explicit criteria."""
-    verifier = TaskVerifier()
-    
     task = Task(
         id="verify-1",
         description="Test task",
@@ -111,10 +123,8 @@ def test_task_verifier_with_criteria():
     assert len(verification["log"]) >= len(task.verification_criteria)
 
 
-def test_task_verifier_no_result():
+def test_task_verifier_no_result(verifier):
     """Test verification fails when task has no result."""
-    verifier = TaskVerifier()
-    
     task = Task(
         id="verify-2",
         description="Test task",
@@ -180,14 +190,9 @@ def test_result_combiner_merge():
     assert len(combined["outputs"]) == 2
 
 
-def test_meta_agent_atomic_task():
+def test_meta_agent_atomic_task(make_meta_agent):
     """Test meta-agent executing an atomic task."""
-    decomposer = TaskDecomposer()
-    executor = TaskExecutor()
-    verifier = TaskVerifier()
-    combiner = ResultCombiner()
-    
-    meta_agent = MetaAgent(decomposer, executor, verifier, combiner)
+    meta_agent = make_meta_agent()
     
     task = Task(
         id="atomic-1",
@@ -205,14 +210,9 @@ def test_meta_agent_atomic_task():
     assert task.status in ["completed", "verified"]
 
 
-def test_meta_agent_decomposable_task():
+def test_meta_agent_decomposable_task(make_meta_agent):
     """Test meta-agent with a task that gets decomposed."""
-    decomposer = TaskDecomposer()
-    executor = TaskExecutor()
-    verifier = TaskVerifier()
-    combiner = ResultCombiner()
-    
-    meta_agent = MetaAgent(decomposer, executor, verifier, combiner, max_depth=3)
+    meta_agent = make_meta_agent(max_depth=3)
     
     task = Task(
         id="decomp-1",
@@ -232,15 +232,10 @@ def test_meta_agent_decomposable_task():
     assert len(execution_tree.sub_tasks) > 0
 
 
-def test_meta_agent_max_depth():
+def test_meta_agent_max_depth(make_meta_agent):
     """Test that meta-agent respects max depth."""
-    decomposer = TaskDecomposer()
-    executor = TaskExecutor()
-    verifier = TaskVerifier()
-    combiner = ResultCombiner()
-    
     # Set max_depth to 0 to force immediate execution
-    meta_agent = MetaAgent(decomposer, executor, verifier, combiner, max_depth=0)
+    meta_agent = make_meta_agent(max_depth=0)
     
     task = Task(
         id="depth-1",
@@ -255,14 +250,9 @@ def test_meta_agent_max_depth():
     assert len(meta_agent.execution_log) > 0
 
 
-def test_meta_agent_logging():
+def test_meta_agent_logging(make_meta_agent):
     """Test that meta-agent logs execution steps."""
-    decomposer = TaskDecomposer()
-    executor = TaskExecutor()
-    verifier = TaskVerifier()
-    combiner = ResultCombiner()
-    
-    meta_agent = MetaAgent(decomposer, executor, verifier, combiner)
+    meta_agent = make_meta_agent()
     
     task = Task(
         id="log-1",
@@ -273,8 +263,8 @@ def test_meta_agent_logging():
     result = meta_agent.solve(task)
     
     assert len(meta_agent.execution_log) > 0
-    assert all("timestamp" in entry for entry in meta_agent.execution_log)
-    assert all("message" in entry for entry in meta_agent.execution_log)
+    assert all(isinstance(entry[0], float) for entry in meta_agent.execution_log)
+    assert all(isinstance(entry[1], str) and entry[1] for entry in meta_agent.execution_log)
 
 
 def test_decomposition_result_structure():
@@ -309,3 +299,22 @@ def test_task_hierarchy():
     assert len(parent.sub_tasks) == 2
     assert child1.parent_id == "parent"
     assert child2.parent_id == "parent"
+
+
+def test_task_clone_resets_state():
+    """Test that clone() copies the task tree and resets execution state."""
+    child = Task(id="child", description="Child", inputs={"x": 1}, parent_id="parent")
+    parent = Task(id="parent", description="Parent", inputs={"x": 1}, verification_criteria=["x"])
+    parent.sub_tasks = [child]
+    parent.status = "verified"
+    parent.result = {"x": 2}
+
+    cloned = parent.clone()
+
+    assert cloned.id == "parent"
+    assert cloned.status == "pending"
+    assert cloned.result is None
+    assert cloned.inputs == {"x": 1} and cloned.inputs is not parent.inputs
+    assert cloned.verification_criteria == ["x"]
+    assert cloned.sub_tasks[0].id == "child"
+    assert cloned.sub_tasks[0] is not child
@@ -0,0 +1,29 @@
+"""Tests for closure-compiled guard predicates."""
+
+import pytest
+from src.workflow.predicates import compile_predicate
+
+
+CASES = [
+    ("value > 0", {"value": 5}, True),
+    ("value > 0", {"value": -1}, False),
+    ("status == 'ok'", {"status": "ok"}, True),
+    ("a > 0 and b > 0", {"a": 1, "b": 0}, False),
+    ("a > 0 or b > 0", {"a": 0, "b": 1}, True),
+    ("0 < x <= 10", {"x": 10}, True),
+    ("0 < x <= 10", {"x": 11}, False),
+    ("not flag", {"flag": False}, True),
+    # Unsupported nodes fall back to eval
+    ("x + 1 == 3", {"x": 2}, True),
+    ("x * 2 == 4", {"x": 3}, False),
+]
+
+
+@pytest.mark.parametrize("expr,ctx,expected", CASES)
+def test_compile_predicate(expr, ctx, expected):
+    assert compile_predicate(expr)(ctx) is expected
+
+
+def test_compile_predicate_unknown_name_raises():
+    with pytest.raises(NameError):
+        compile_predicate("missing == 1")({})
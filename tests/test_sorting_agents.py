@@ -1,24 +1,46 @@
 import pytest
 
 from src.tools.registry import split_in_half, compare_and_return, join_two_sorted_lists
-from src.workflow.loader import load_yaml_to_meta_agent
 from src.meta_agent import MetaAgent, TaskExecutor
 from src.workflow.factory import reset_agent_creation_count, get_agent_creation_count
 
 
+# Common locations for the sorted list, tried in order
+_SORTED_PATHS = (
+    ('sorted_numbers',),
+    # result might be nested as {'result': {...}}
+    ('result', 'sorted_numbers'),
+)
+
+
+def _get_path(d, path):
+    for k in path:
+        if not isinstance(d, dict) or k not in d:
+            return None
+        d = d[k]
+    return d
+
+
 def extract_sorted(result):
-    # Try common locations for sorted list
-    if not result:
-        return None
-    if isinstance(result, dict):
-        if 'sorted_numbers' in result:
-            return result['sorted_numbers']
-        # result might be nested as {'result': {...}}
-        if 'result' in result and isinstance(result['result'], dict) and 'sorted_numbers' in result['result']:
-            return result['result']['sorted_numbers']
+    for path in _SORTED_PATHS:
+        v = _get_path(result, path)
+        if v is not None:
+            return v
     return None
 
 
+@pytest.mark.parametrize("cond,ctx,expected", [
+    ("len(numbers) == 2", {"numbers": [1, 2]}, True),
+    ("len(numbers) != 1", {"numbers": [1, 2]}, True),
+    # placeholder strings are never measured, whatever the operator
+    ("len(numbers) != 1", {"numbers": "left"}, False),
+    ("len(numbers) + 1 > 0", {"numbers": "left"}, False),
+])
+def test_len_guards_ignore_placeholders(cond, ctx, expected):
+    from src.workflow.loader import _eval_simple_condition
+    assert _eval_simple_condition(cond, ctx) is expected
+
+
 def test_split_in_half_basic():
     out = split_in_half([1, 2, 3, 4])
     assert out == {'left': [1, 2], 'right': [3, 4]}
@@ -34,65 +56,55 @@ def test_join_two_sorted_lists_basic():
     assert out == {'sorted_numbers': [1, 2, 3, 4]}
 
 
-def test_meta_agent_sorts_len2():
-    root, decomposer, verifier, combiner = load_yaml_to_meta_agent('specs/yaml/sorting.yaml')
+def _run_sort(sorting_spec, numbers):
+    """Solve a fresh copy of the sorting workflow; returns (res, agent_count)."""
+    root_proto, decomposer, verifier, combiner = sorting_spec
+    root = root_proto.clone()
     reset_agent_creation_count()
     executor = TaskExecutor()
     meta = MetaAgent(decomposer=decomposer, executor=executor, verifier=verifier, combiner=combiner)
 
-    root.inputs = {'numbers': [2, 1]}
+    root.inputs = {'numbers': numbers}
     res = meta.solve(root)
+    return res, get_agent_creation_count()
 
-    assert res['verified'] is True
+
+def _sorted_result(res):
     sorted_list = extract_sorted(res.get('result'))
     # combiner may place result at top-level or nested; also try execution_tree
     if sorted_list is None:
         et = res.get('execution_tree')
         if et and getattr(et, 'result', None):
             sorted_list = et.result.get('sorted_numbers')
-
-    assert sorted_list == [1, 2]
-    assert get_agent_creation_count() >= 1
+    return sorted_list
 
 
-def test_meta_agent_sorts_len3():
-    root, decomposer, verifier, combiner = load_yaml_to_meta_agent('specs/yaml/sorting.yaml')
-    reset_agent_creation_count()
-    executor = TaskExecutor()
-    meta = MetaAgent(decomposer=decomposer, executor=executor, verifier=verifier, combiner=combiner)
-
-    root.inputs = {'numbers': [3, 1, 2]}
-    res = meta.solve(root)
-
-    assert res['verified'] is True
-    sorted_list = extract_sorted(res.get('result'))
-    if sorted_list is None:
-        et = res.get('execution_tree')
-        if et and getattr(et, 'result', None):
-            sorted_list = et.result.get('sorted_numbers')
-
-    assert sorted_list == [1, 2, 3]
+@pytest.mark.parametrize("numbers,min_agents", [
+    pytest.param([2, 1], 1, id="len2"),
     # expect multiple atomic executions for split/compare/merge
-    assert get_agent_creation_count() >= 2
-
-
-def test_meta_agent_sorts_len8_agent_count():
-    """Run the 8-element sorting workflow and assert atomic agent count is within expected bound."""
-    root, decomposer, verifier, combiner = load_yaml_to_meta_agent('specs/yaml/sorting.yaml')
-    reset_agent_creation_count()
-    executor = TaskExecutor()
-    meta = MetaAgent(decomposer=decomposer, executor=executor, verifier=verifier, combiner=combiner)
-
-    root.inputs = {'numbers': [8, 7, 6, 5, 4, 3, 2, 1]}
-    res = meta.solve(root)
+    pytest.param([3, 1, 2], 2, id="len3"),
+])
+def test_meta_agent_sorts(sorting_spec, numbers, min_agents):
+    res, count = _run_sort(sorting_spec, numbers)
 
     assert res['verified'] is True
-    sorted_list = extract_sorted(res.get('result'))
-    if sorted_list is None:
-        et = res.get('execution_tree')
-        if et and getattr(et, 'result', None):
-            sorted_list = et.result.get('sorted_numbers')
+    assert _sorted_result(res) == sorted(numbers)
+    assert count >= min_agents
+
+
+def test_meta_agent_sorts_len8_agent_count(benchmark, sorting_spec):
+    """
+    Run the 8-element sorting workflow, benchmarking the solve and bounding the atomic agent count.
+    pytest-benchmark disables itself under the default xdist run and calls the solve once, so only
+    the agent-count bound is checked; run `python -m pytest -n 0 tests/test_sorting_agents.py`
+    to collect timings.
+    """
+    numbers = [8, 7, 6, 5, 4, 3, 2, 1]
+    # each round solves a fresh clone with a reset counter, so count is per-solve
+    res, count = benchmark(_run_sort, sorting_spec, numbers)
+    benchmark.extra_info["agent_count"] = count
 
-    assert sorted_list == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert res['verified'] is True
+    assert _sorted_result(res) == [1, 2, 3, 4, 5, 6, 7, 8]
     # For divide-and-conquer merge sort, 8 elements should need at most 15 atomic actions
-    assert get_agent_creation_count() <= 15, f"Too many atomic agents: {get_agent_creation_count()}"
+    assert count <= 15, f"Too many atomic agents: {count}"
@@ -1,53 +1,113 @@
 import pytest
-from src.workflow import compiler, executor
 
 
-def test_workflow_call_agent_inline_child(tmp_path):
-    # Child workflow (simple tool call that returns an 'order')
+# Child workflow (simple tool call that returns an 'order')
+CHILD = {
+    "name": "child_workflow",
+    "description": "returns an order",
+    "inputs": ["order_id", "customer_id"],
+    "outputs": ["order"],
+    "nodes": [
+        {
+            "id": "get_order",
+            "type": "tool",
+            "params": {"tool": "orders.get"},
+            "io": {"inputs": ["order_id", "customer_id"], "outputs": ["order"]},
+        },
+    ],
+    "edges": [],
+    "preconditions": [],
+    "success_criteria": ["order != None"],
+    "failure_conditions": [],
+}
+
+# Parent workflow that calls the child via workflow_call with an inline workflow
+PARENT = {
+    "name": "parent_workflow",
+    "description": "calls child workflow",
+    "inputs": ["order_id", "customer_id"],
+    "outputs": ["order"],
+    "nodes": [
+        {
+            "id": "call_child",
+            "type": "workflow_call",
+            "params": {"workflow": CHILD},
+            "io": {"inputs": ["order_id", "customer_id"], "outputs": ["order"]},
+        },
+    ],
+    "edges": [],
+    "preconditions": [],
+    "success_criteria": ["order != None"],
+    "failure_conditions": [],
+}
+
+
+def test_workflow_call_agent_inline_child():
+    from src.workflow import compiler, executor
+
+    wf = compiler.load_workflow(PARENT)
+
+    inputs = {"order_id": "o-123", "customer_id": "c-456"}
+    outputs = executor.run_workflow(wf, inputs)
+
+    assert "order" in outputs
+    assert outputs["order"]["id"] == "o-123"
+
+
+def test_workflow_call_agent_compiles_child_once(monkeypatch):
+    from src.workflow import compiler, executor
+
+    wf = compiler.load_workflow(PARENT)
+    loads = []
+    real_load = compiler.load_workflow
+    monkeypatch.setattr(compiler, "load_workflow", lambda src: loads.append(src) or real_load(src))
+
+    for order_id in ("o-1", "o-2"):
+        outputs = executor.run_workflow(wf, {"order_id": order_id, "customer_id": "c-456"})
+        assert outputs["order"]["id"] == order_id
+    assert len(loads) == 1
+
+
+def test_workflow_call_agent_reloads_edited_child_file(tmp_path):
+    from src.tools.registry import register_tool
+    from src.workflow import compiler, executor
+
+    register_tool("test.plus_one", positional=True)(lambda x: {"y": x + 1})
+    register_tool("test.plus_hundred", positional=True)(lambda x: {"y": x + 100})
+    child = tmp_path / "child.yaml"
     child_yaml = """
-name: child_workflow
-description: returns an order
-inputs: [order_id, customer_id]
-outputs: [order]
+name: file_child
+inputs: [x]
+outputs: [y]
+preconditions: []
+success_criteria: []
+failure_conditions: []
 nodes:
-  - id: get_order
+  - id: step
     type: tool
-    params:
-      tool: orders.get
-    io:
-      inputs: [order_id, customer_id]
-      outputs: [order]
+    params: { tool: "%s" }
+    io: { inputs: [x], outputs: [y] }
+    tests: []
 edges: []
+"""
+    parent_yaml = """
+name: file_parent
+inputs: [x]
+outputs: [y]
 preconditions: []
-success_criteria: ["order != None"]
+success_criteria: []
 failure_conditions: []
-"""
-
-    # Parent workflow that calls the child via workflow_call with inline YAML
-    parent_yaml = f"""
-name: parent_workflow
-description: calls child workflow
-inputs: [order_id, customer_id]
-outputs: [order]
 nodes:
   - id: call_child
     type: workflow_call
-    params:
-      workflow_text: |
-{child_yaml.replace('\n', '\n        ')}
-    io:
-      inputs: [order_id, customer_id]
-      outputs: [order]
+    params: { workflow_file: "%s" }
+    io: { inputs: [x], outputs: [y] }
+    tests: []
 edges: []
-preconditions: []
-success_criteria: ["order != None"]
-failure_conditions: []
-"""
+""" % child
 
-    wf = compiler.load_workflow(parent_yaml)
+    child.write_text(child_yaml % "test.plus_one")
+    assert executor.run_workflow(compiler.load_workflow(parent_yaml), {"x": 1}) == {"y": 2}
 
-    inputs = {"order_id": "o-123", "customer_id": "c-456"}
-    outputs = executor.run_workflow(wf, inputs)
-
-    assert "order" in outputs
-    assert outputs["order"]["id"] == "o-123"
+    child.write_text(child_yaml % "test.plus_hundred")
+    assert executor.run_workflow(compiler.load_workflow(parent_yaml), {"x": 1}) == {"y": 101}
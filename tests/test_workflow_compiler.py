@@ -1,13 +1,11 @@
 """Tests for workflow compiler (YAML loading and validation)."""
 
 import pytest
-from src.workflow.compiler import load_workflow
+from src.workflow.compiler import load_workflow, load_workflow_dict
 from src.workflow.models import Workflow, Node, Edge
 
 
-def test_load_workflow_from_valid_yaml():
-    """Test loading a valid workflow from YAML."""
-    yaml_text = """
+VALID_YAML = """
 name: test_workflow
 description: A test workflow
 inputs: [input1, input2]
@@ -34,9 +32,9 @@ nodes:
 edges:
   - { from: step1, to: step2, when: "true" }
 """
-    
-    workflow = load_workflow(yaml_text)
-    
+
+
+def check_valid(workflow):
     assert workflow.name == "test_workflow"
     assert workflow.description == "A test workflow"
     assert workflow.inputs == ["input1", "input2"]
@@ -47,134 +45,122 @@ edges:
     assert workflow.nodes[1].id == "step2"
 
 
+def test_load_workflow_caches_identical_text():
+    """Identical YAML text is parsed and compiled once."""
+    assert load_workflow(VALID_YAML) is load_workflow(VALID_YAML)
+
+
 def test_load_workflow_missing_required_field():
     """Test that missing required fields raise ValueError."""
-    yaml_text = """
-name: incomplete_workflow
-inputs: [input1]
-# Missing: nodes, edges, success_criteria, failure_conditions
-"""
+    # Missing: nodes, edges, success_criteria, failure_conditions
+    data = {"name": "incomplete_workflow", "inputs": ["input1"]}
     
     with pytest.raises(ValueError, match="Missing required top-level field"):
-        load_workflow(yaml_text)
+        load_workflow_dict(data)
+
+
+CYCLIC_WF = {
+    "name": "cyclic_workflow",
+    "inputs": ["input1"],
+    "outputs": ["output1"],
+    "success_criteria": [],
+    "failure_conditions": [],
+    "nodes": [
+        {"id": "step1", "type": "tool", "params": {"tool": "tool1"},
+         "io": {"inputs": ["input1"], "outputs": ["result1"]}},
+        {"id": "step2", "type": "tool", "params": {"tool": "tool2"},
+         "io": {"inputs": ["result1"], "outputs": ["result2"]}},
+        {"id": "step3", "type": "tool", "params": {"tool": "tool3"},
+         "io": {"inputs": ["result2"], "outputs": ["output1"]}},
+    ],
+    "edges": [
+        {"from": "step1", "to": "step2"},
+        {"from": "step2", "to": "step3"},
+        {"from": "step3", "to": "step1"},  # Creates a cycle!
+    ],
+}
 
 
 def test_validate_workflow_detects_cycle():
     """Test that cyclic workflows are rejected."""
-    yaml_text = """
-name: cyclic_workflow
-inputs: [input1]
-outputs: [output1]
-success_criteria: []
-failure_conditions: []
+    with pytest.raises(ValueError, match="Cycle detected"):
+        load_workflow_dict(CYCLIC_WF)
 
-nodes:
-  - id: step1
-    type: tool
-    params: { tool: "tool1" }
-    io: { inputs: [input1], outputs: [result1] }
-    
-  - id: step2
-    type: tool
-    params: { tool: "tool2" }
-    io: { inputs: [result1], outputs: [result2] }
-    
-  - id: step3
-    type: tool
-    params: { tool: "tool3" }
-    io: { inputs: [result2], outputs: [output1] }
 
-edges:
-  - { from: step1, to: step2 }
-  - { from: step2, to: step3 }
-  - { from: step3, to: step1 }  # Creates a cycle!
-"""
-    
-    with pytest.raises(ValueError, match="Cycle detected"):
-        load_workflow(yaml_text)
+INVALID_EDGE_WF = {
+    "name": "invalid_edge_workflow",
+    "inputs": ["input1"],
+    "outputs": ["output1"],
+    "success_criteria": [],
+    "failure_conditions": [],
+    "nodes": [
+        {"id": "step1", "type": "tool", "params": {"tool": "tool1"},
+         "io": {"inputs": ["input1"], "outputs": ["result1"]}},
+    ],
+    "edges": [
+        {"from": "step1", "to": "nonexistent_step"},  # Unknown node!
+    ],
+}
 
 
 def test_validate_workflow_detects_unknown_node_in_edge():
     """Test that edges referencing unknown nodes are rejected."""
-    yaml_text = """
-name: invalid_edge_workflow
-inputs: [input1]
-outputs: [output1]
-success_criteria: []
-failure_conditions: []
-
-nodes:
-  - id: step1
-    type: tool
-    params: { tool: "tool1" }
-    io: { inputs: [input1], outputs: [result1] }
-
-edges:
-  - { from: step1, to: nonexistent_step }  # Unknown node!
-"""
-    
     with pytest.raises(ValueError, match="Edge references unknown node"):
-        load_workflow(yaml_text)
+        load_workflow_dict(INVALID_EDGE_WF)
+
+
+BRANCHING_WF = {
+    "name": "branching_workflow",
+    "inputs": ["value"],
+    "outputs": ["output"],
+    "success_criteria": [],
+    "failure_conditions": [],
+    "nodes": [
+        {"id": "check", "type": "router", "params": {},
+         "io": {"inputs": ["value"], "outputs": ["is_valid"]}},
+        {"id": "process_valid", "type": "tool", "params": {"tool": "process"},
+         "io": {"inputs": ["value"], "outputs": ["output"]}},
+        {"id": "process_invalid", "type": "tool", "params": {"tool": "reject"},
+         "io": {"inputs": ["value"], "outputs": ["output"]}},
+    ],
+    "edges": [
+        {"from": "check", "to": "process_valid", "when": "is_valid == true"},
+        {"from": "check", "to": "process_invalid", "when": "is_valid == false"},
+    ],
+}
 
 
 def test_load_workflow_with_conditional_edges():
     """Test loading a workflow with conditional edges."""
-    yaml_text = """
-name: branching_workflow
-inputs: [value]
-outputs: [output]
-success_criteria: []
-failure_conditions: []
-
-nodes:
-  - id: check
-    type: router
-    params: {}
-    io: { inputs: [value], outputs: [is_valid] }
-    
-  - id: process_valid
-    type: tool
-    params: { tool: "process" }
-    io: { inputs: [value], outputs: [output] }
-    
-  - id: process_invalid
-    type: tool
-    params: { tool: "reject" }
-    io: { inputs: [value], outputs: [output] }
-
-edges:
-  - { from: check, to: process_valid, when: "is_valid == true" }
-  - { from: check, to: process_invalid, when: "is_valid == false" }
-"""
-    
-    workflow = load_workflow(yaml_text)
+    workflow = load_workflow_dict(BRANCHING_WF)
     
     assert len(workflow.edges) == 2
     assert workflow.edges[0].when == "is_valid == true"
     assert workflow.edges[1].when == "is_valid == false"
-
-
-def test_load_workflow_preserves_node_metadata():
-    """Test that all node metadata is preserved during loading."""
-    yaml_text = """
-name: metadata_test
-inputs: [x]
-outputs: [y]
-success_criteria: []
-failure_conditions: []
-
-nodes:
-  - id: process
-    type: tool
-    summary: This processes the input
-    params: { tool: "processor", mode: "fast" }
-    io: { inputs: [x], outputs: [y] }
-    tests: ["y > 0", "y != None"]
-
-edges: []
-"""
-    
-    workflow = load_workflow(yaml_text)
+    # Guards are compiled at load time
+    ctx = {"is_valid": True, "true": True, "false": False}
+    assert workflow.edges[0].when_check(ctx) is True
+    assert workflow.edges[1].when_check(ctx) is False
+
+
+METADATA_WF = {
+    "name": "metadata_test",
+    "inputs": ["x"],
+    "outputs": ["y"],
+    "success_criteria": [],
+    "failure_conditions": [],
+    "nodes": [
+        {"id": "process", "type": "tool", "summary": "This processes the input",
+         "params": {"tool": "processor", "mode": "fast"},
+         "io": {"inputs": ["x"], "outputs": ["y"]},
+         "tests": ["y > 0", "y != None"]},
+    ],
+    "edges": [],
+}
+
+
+def check_metadata(workflow):
+    """All node metadata is preserved during loading."""
     node = workflow.nodes[0]
     
     assert node.id == "process"
@@ -186,38 +172,43 @@ edges: []
     assert node.tests == ["y > 0", "y != None"]
 
 
-def test_load_workflow_with_multiple_entry_points():
-    """Test loading a DAG with multiple entry points (zero in-degree)."""
-    yaml_text = """
-name: multi_entry_workflow
-inputs: [a, b]
-outputs: [result]
-success_criteria: []
-failure_conditions: []
-
-nodes:
-  - id: process_a
-    type: tool
-    params: { tool: "tool_a" }
-    io: { inputs: [a], outputs: [a_result] }
-    
-  - id: process_b
-    type: tool
-    params: { tool: "tool_b" }
-    io: { inputs: [b], outputs: [b_result] }
-    
-  - id: combine
-    type: tool
-    params: { tool: "combiner" }
-    io: { inputs: [a_result, b_result], outputs: [result] }
-
-edges:
-  - { from: process_a, to: combine }
-  - { from: process_b, to: combine }
-"""
-    
-    workflow = load_workflow(yaml_text)
-    
+MULTI_ENTRY_WF = {
+    "name": "multi_entry_workflow",
+    "inputs": ["a", "b"],
+    "outputs": ["result"],
+    "success_criteria": [],
+    "failure_conditions": [],
+    "nodes": [
+        {"id": "process_a", "type": "tool", "params": {"tool": "tool_a"},
+         "io": {"inputs": ["a"], "outputs": ["a_result"]}},
+        {"id": "process_b", "type": "tool", "params": {"tool": "tool_b"},
+         "io": {"inputs": ["b"], "outputs": ["b_result"]}},
+        {"id": "combine", "type": "tool", "params": {"tool": "combiner"},
+         "io": {"inputs": ["a_result", "b_result"], "outputs": ["result"]}},
+    ],
+    "edges": [
+        {"from": "process_a", "to": "combine"},
+        {"from": "process_b", "to": "combine"},
+    ],
+}
+
+
+def check_multi_entry(workflow):
+    """A DAG with multiple entry points (zero in-degree) loads intact."""
     assert len(workflow.nodes) == 3
     assert len(workflow.edges) == 2
     # Both process_a and process_b should have in-degree 0
+    assert workflow.layers == [["process_a", "process_b"], ["combine"]]
+
+
+# Happy-path loads; VALID_YAML also covers the YAML parsing path
+HAPPY_CASES = [
+    pytest.param(VALID_YAML, check_valid, id="valid_yaml"),
+    pytest.param(METADATA_WF, check_metadata, id="metadata"),
+    pytest.param(MULTI_ENTRY_WF, check_multi_entry, id="multi_entry"),
+]
+
+
+@pytest.mark.parametrize("source,check", HAPPY_CASES)
+def test_load_workflow_happy_path(source, check):
+    check(load_workflow(source))